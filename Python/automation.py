@@ -2,27 +2,47 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import selectors
 import shlex
 import signal
 import subprocess
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Mapping, MutableMapping, Optional, Sequence
+from typing import IO, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
 
 __all__ = [
     "ToolError",
     "ProcessResult",
+    "OutputScanner",
     "merge_env",
     "spawn_process",
     "format_command_for_display",
     "make_log_path",
 ]
 
+_READ_CHUNK_SIZE = 64 * 1024
+_LOG_BUFFER_SIZE = 1 << 20
+_LOG_FLUSH_INTERVAL_SECONDS = 1.0
+_TAIL_LINE_COUNT = 50
+_TAIL_READ_BYTES = 16 * 1024
+_SPLICE_CHUNK_SIZE = 1 << 20
+_MAX_PENDING_BYTES = 1 << 20
+_HAS_SPLICE = hasattr(os, "splice")
+_IS_WINDOWS = os.name == "nt"
+
+logger = logging.getLogger(__name__)
+
+
+OutputScanner = Callable[[bytes], None]
+"""Callback receiving process output in blocks that end on a line boundary.
+
+A line longer than ``_MAX_PENDING_BYTES`` is delivered in pieces instead.
+"""
+
 
 class ToolError(Exception):
     """Custom exception used for structured tool errors."""
@@ -57,21 +77,27 @@ class ProcessResult:
 def merge_env(custom: Optional[Mapping[str, object]]) -> Dict[str, str]:
     """Merge a custom environment mapping with the current environment."""
 
-    env: MutableMapping[str, str] = dict(os.environ)
-    if custom:
-        for key, value in custom.items():
-            env[str(key)] = str(value)
-    return dict(env)
+    if not custom:
+        return dict(os.environ)
+    return {**os.environ, **{str(key): str(value) for key, value in custom.items()}}
+
 
+def _as_str_list(command: Sequence[object]) -> List[str]:
+    """Return ``command`` as a list of strings, reusing it when it already is one."""
 
-def _terminate_process(process: subprocess.Popen[str]) -> None:
+    if isinstance(command, list) and all(isinstance(part, str) for part in command):
+        return command  # type: ignore[return-value]
+    return [str(part) for part in command]
+
+
+def _terminate_process(process: subprocess.Popen[bytes]) -> None:
     """Attempt to terminate the process tree for the given process."""
 
     if process.poll() is not None:
         return
 
     try:
-        if os.name == "nt":
+        if _IS_WINDOWS:
             process.send_signal(signal.CTRL_BREAK_EVENT)  # type: ignore[arg-type]
         else:
             os.killpg(process.pid, signal.SIGTERM)
@@ -82,37 +108,110 @@ def _terminate_process(process: subprocess.Popen[str]) -> None:
             pass
 
 
-def _kill_process(process: subprocess.Popen[str]) -> None:
+def _kill_process(process: subprocess.Popen[bytes]) -> None:
     """Forcefully kill the given process."""
 
     if process.poll() is not None:
         return
     try:
-        if os.name != "nt":
+        if not _IS_WINDOWS:
             os.killpg(process.pid, signal.SIGKILL)
         process.kill()
     except Exception:
         pass
 
 
+def _tail_lines(log_path: Path, count: int = _TAIL_LINE_COUNT) -> List[str]:
+    """Return the last ``count`` lines of ``log_path`` by reading only its tail."""
+
+    try:
+        with open(log_path, "rb") as log_file:
+            size = log_file.seek(0, os.SEEK_END)
+            offset = log_file.seek(max(0, size - _TAIL_READ_BYTES))
+            tail = log_file.read()
+    except OSError:
+        return []
+    lines = tail.splitlines()
+    if offset and lines:
+        # The first line is most likely cut in half by the seek.
+        lines = lines[1:]
+    if not lines:
+        return []
+    # Decode the kept lines in one pass rather than once per line.
+    return b"\n".join(lines[-count:]).decode("utf-8", errors="replace").split("\n")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _iter_readable(fd: int, wakeup_fd: int) -> Iterator[bool]:
+    """Yield ``True`` whenever ``fd`` is readable and ``False`` on idle ticks.
+
+    Iteration stops as soon as ``wakeup_fd`` becomes readable, which lets the
+    caller cancel a reader even if the child still holds the pipe open.
+    """
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        selector.register(wakeup_fd, selectors.EVENT_READ)
+        while True:
+            events = selector.select(timeout=_LOG_FLUSH_INTERVAL_SECONDS)
+            if any(key.fd == wakeup_fd for key, _ in events):
+                return
+            yield bool(events)
+
+
+def _read_chunks(pipe: IO[bytes], wakeup_fd: Optional[int]) -> Iterator[bytes]:
+    """Yield output chunks from ``pipe`` until EOF, with ``b""`` on idle ticks."""
+
+    if wakeup_fd is None:
+        # Windows selectors only support sockets, so fall back to blocking reads.
+        yield from iter(lambda: pipe.read1(_READ_CHUNK_SIZE), b"")
+        return
+    fd = pipe.fileno()
+    os.set_blocking(fd, False)
+    for readable in _iter_readable(fd, wakeup_fd):
+        if not readable:
+            yield b""
+            continue
+        try:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+        except BlockingIOError:
+            continue
+        if not chunk:
+            return
+        yield chunk
+
+
 def spawn_process(
     command: Sequence[object],
     *,
     log_path: Path,
     env: Optional[Mapping[str, object]] = None,
     timeout_seconds: Optional[int] = None,
+    output_scanner: Optional[OutputScanner] = None,
 ) -> ProcessResult:
-    """Spawn an external process, teeing stdout/stderr into a log file."""
+    """Spawn an external process, teeing stdout/stderr into a log file.
+
+    When ``output_scanner`` is given it is called from the reader thread with
+    each block of complete lines as soon as it has been written to the log, so
+    callers can extract results without reading the log file a second time.
+    If the scanner raises, the error is logged and scanning stops; the output
+    is still drained into the log.
+    """
 
     log_path = log_path.expanduser().resolve()
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
     merged_env = merge_env(env)
-    command_list = [str(part) for part in command]
+    command_list = _as_str_list(command)
 
     creationflags = 0
     preexec_fn = None
-    if os.name == "nt":
+    if _IS_WINDOWS:
         creationflags = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
     else:
         preexec_fn = os.setsid  # type: ignore[assignment]
@@ -122,27 +221,88 @@ def spawn_process(
         command_list,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
         env=merged_env,
         creationflags=creationflags,
         preexec_fn=preexec_fn,
     )
 
-    last_lines: deque[str] = deque(maxlen=50)
+    def _splice_reader() -> None:
+        assert process.stdout is not None
+        assert wakeup_read is not None
+        pipe_fd = process.stdout.fileno()
+        log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        splicing = True
+        try:
+            os.set_blocking(pipe_fd, False)
+            for readable in _iter_readable(pipe_fd, wakeup_read):
+                if not readable:
+                    continue
+                try:
+                    if splicing:
+                        moved = os.splice(pipe_fd, log_fd, _SPLICE_CHUNK_SIZE, flags=os.SPLICE_F_NONBLOCK)
+                    else:
+                        chunk = os.read(pipe_fd, _READ_CHUNK_SIZE)
+                        moved = len(chunk)
+                        _write_all(log_fd, chunk)
+                except BlockingIOError:
+                    continue
+                except OSError as exc:
+                    if not splicing:
+                        raise
+                    # e.g. EINVAL when the log's filesystem does not support splice;
+                    # nothing was moved, so copy the rest of the stream in userspace.
+                    logger.debug("splice() into %s failed (%s); falling back to read/write", log_path, exc)
+                    splicing = False
+                    continue
+                if not moved:
+                    break
+        except OSError as exc:
+            logger.warning("Stopped capturing process output to %s: %s", log_path, exc)
+        finally:
+            os.close(log_fd)
 
     def _reader() -> None:
         assert process.stdout is not None
-        with open(log_path, "a", encoding="utf-8", errors="replace") as log_file:
-            for line in iter(process.stdout.readline, ""):
-                log_file.write(line)
-                log_file.flush()
-                last_lines.append(line.rstrip("\n"))
-
-    with open(log_path, "w", encoding="utf-8", errors="replace"):
-        pass
-
-    reader_thread = threading.Thread(target=_reader, daemon=True)
+        scanner = output_scanner
+        pending = b""
+
+        def scan(block: bytes) -> None:
+            nonlocal scanner
+            try:
+                scanner(block)  # type: ignore[misc]
+            except Exception:
+                # Keep draining the pipe into the log; only the scanning stops.
+                logger.exception("Output scanner failed; continuing without it")
+                scanner = None
+
+        with open(log_path, "wb", buffering=_LOG_BUFFER_SIZE) as log_file:
+            next_flush = time.monotonic() + _LOG_FLUSH_INTERVAL_SECONDS
+            for chunk in _read_chunks(process.stdout, wakeup_read):
+                if chunk:
+                    log_file.write(chunk)
+                if chunk and scanner is not None:
+                    line_end = chunk.rfind(b"\n")
+                    if line_end < 0:
+                        pending += chunk
+                        if len(pending) >= _MAX_PENDING_BYTES:
+                            scan(pending)
+                            pending = b""
+                    else:
+                        scan(pending + chunk[: line_end + 1])
+                        pending = chunk[line_end + 1 :]
+                now = time.monotonic()
+                if now >= next_flush:
+                    log_file.flush()
+                    next_flush = now + _LOG_FLUSH_INTERVAL_SECONDS
+        if scanner is not None and pending:
+            scan(pending)
+
+    # On Linux the pipe is drained into the log file in-kernel unless the caller
+    # needs to see the output; otherwise it goes through a buffered Python reader.
+    use_splice = _HAS_SPLICE and output_scanner is None
+    # Self-pipe used to wake the reader if the pipe never reaches EOF.
+    wakeup_read, wakeup_write = (None, None) if _IS_WINDOWS else os.pipe()
+    reader_thread = threading.Thread(target=_splice_reader if use_splice else _reader, daemon=True)
     reader_thread.start()
 
     timed_out = False
@@ -159,14 +319,21 @@ def spawn_process(
             _kill_process(process)
             exit_code = process.wait()
 
+    # Let the reader drain whatever is left in the pipe before closing it.
+    reader_thread.join(timeout=5)
+    if wakeup_write is not None:
+        # A grandchild may still hold the pipe open; stop the reader regardless.
+        os.write(wakeup_write, b"\0")
+        reader_thread.join()
+        os.close(wakeup_write)
+        os.close(wakeup_read)
+
     if process.stdout is not None:
         try:
             process.stdout.close()
         except Exception:
             pass
 
-    reader_thread.join(timeout=5)
-
     duration_seconds = time.monotonic() - start_time
 
     return ProcessResult(
@@ -174,15 +341,15 @@ def spawn_process(
         duration_seconds=duration_seconds,
         timed_out=timed_out,
         log_path=log_path,
-        last_lines=list(last_lines),
+        last_lines=_tail_lines(log_path),
     )
 
 
 def format_command_for_display(command: Sequence[object]) -> str:
     """Format a command list into a display-friendly string."""
 
-    command_list = [str(part) for part in command]
-    if os.name == "nt":
+    command_list = _as_str_list(command)
+    if _IS_WINDOWS:
         return subprocess.list2cmdline(command_list)
     return shlex.join(command_list)
 
@@ -197,6 +364,6 @@ def make_log_path(
     """Return a timestamped log path under the given root."""
 
     if timestamp is None:
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     filename = f"{prefix}_{timestamp}{suffix}"
     return root.expanduser().resolve() / filename
@@ -5,8 +5,9 @@ from __future__ import annotations
 import os
 import platform
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -21,11 +22,20 @@ from automation import (
 LOG_ROOT = Path("logs") / "automation"
 REPORT_ROOT = LOG_ROOT / "reports"
 
-SUMMARY_RE = re.compile(
-    r"LogAutomationController:\s+\w+:\s+Tests? Completed\. \(Pass/Fail/Skipped = (\d+)/(\d+)/(\d+)\)",
-    re.IGNORECASE,
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM.startswith("windows")
+_IS_MAC = _SYSTEM.startswith("darwin") or "mac" in _SYSTEM
+
+# Unreal prefixes log lines with a timestamp/frame counter, so the patterns
+# cannot be anchored at line start; whitespace is restricted to blanks and a
+# failure message stops at CR or LF, so a match never spans two lines of the
+# streamed output (a lone CR ends a line, as it did when the log was read as text).
+RESULT_LINE_RE = re.compile(
+    rb"(?P<summary>(?i:LogAutomationController:[ \t]+\w+:[ \t]+Tests? Completed\. "
+    rb"\(Pass/Fail/Skipped = (\d+)/(\d+)/(\d+)\)))"
+    rb"|(?P<failure>LogAutomationController:[ \t]+(?:Error|Warning):[ \t]+([^\r\n]*))",
+    re.ASCII,
 )
-FAILURE_RE = re.compile(r"LogAutomationController:\s+(Error|Warning):\s+(.*)")
 
 
 @dataclass
@@ -33,6 +43,7 @@ class AutomationSpecsConfig:
     """Parsed configuration for Automation RunTests invocations."""
 
     engine_root: Path
+    editor_cmd: Path
     uproject: Path
     tests: List[str]
     map_name: Optional[str]
@@ -41,15 +52,43 @@ class AutomationSpecsConfig:
     extra_args: List[str]
     env: Dict[str, str]
 
-    @property
-    def editor_cmd(self) -> Path:
-        binaries_dir = self.engine_root / "Engine" / "Binaries"
-        system_name = platform.system().lower()
-        if system_name.startswith("windows"):
-            return binaries_dir / "Win64" / "UnrealEditor-Cmd.exe"
-        if system_name.startswith("darwin") or "mac" in system_name:
-            return binaries_dir / "Mac" / "UnrealEditor-Cmd"
-        return binaries_dir / "Linux" / "UnrealEditor-Cmd"
+
+def _editor_cmd_path(engine_root: Path) -> Path:
+    binaries_dir = engine_root / "Engine" / "Binaries"
+    if _IS_WINDOWS:
+        return binaries_dir / "Win64" / "UnrealEditor-Cmd.exe"
+    if _IS_MAC:
+        return binaries_dir / "Mac" / "UnrealEditor-Cmd"
+    return binaries_dir / "Linux" / "UnrealEditor-Cmd"
+
+
+@lru_cache(maxsize=16)
+def _validate_engine_root(engine_root_str: str) -> None:
+    """Check once per engine root that it looks like an Unreal Engine install.
+
+    Failures raise ``ToolError`` and are therefore not cached.
+    """
+
+    if not (Path(engine_root_str) / "Engine").exists():
+        raise ToolError("ENGINE_NOT_FOUND", "engineRoot does not appear to be a valid Unreal Engine installation.")
+
+
+@lru_cache(maxsize=16)
+def _resolve_editor_cmd(engine_root_str: str) -> Path:
+    """Return UnrealEditor-Cmd under the engine root, checking it exists once per root.
+
+    Failures raise ``ToolError`` and are therefore not cached.
+    """
+
+    engine_root = Path(engine_root_str)
+    editor_cmd = _editor_cmd_path(engine_root)
+    if not editor_cmd.exists():
+        raise ToolError(
+            "ENGINE_NOT_FOUND",
+            "UnrealEditor-Cmd executable not found under engineRoot.",
+            {"expected": str(editor_cmd)},
+        )
+    return editor_cmd
 
 
 def _parse_timeout(payload: Dict[str, Any]) -> Optional[int]:
@@ -76,10 +115,12 @@ def _normalize_string_sequence(value: Any, *, default: Optional[Sequence[str]] =
 def _ensure_path(path_str: Any, *, code: str, what: str) -> Path:
     if not path_str:
         raise ToolError(code, f"{what} is required.")
-    candidate = Path(str(path_str)).expanduser().resolve()
-    if not candidate.exists():
-        raise ToolError(code, f"{what} does not exist.", {what: str(candidate)})
-    return candidate
+    candidate = os.path.realpath(os.path.expanduser(str(path_str)))
+    try:
+        os.stat(candidate)
+    except OSError:
+        raise ToolError(code, f"{what} does not exist.", {what: candidate})
+    return Path(candidate)
 
 
 def _build_exec_cmds(tests: Sequence[str]) -> str:
@@ -97,55 +138,49 @@ def _pick_report_xml(report_dir: Path) -> Optional[Path]:
     return None
 
 
-def _parse_failures(log_path: Path) -> List[Dict[str, str]]:
-    failures: List[Dict[str, str]] = []
-    with open(log_path, "r", encoding="utf-8", errors="replace") as log_file:
-        for line in log_file:
-            match = FAILURE_RE.search(line)
-            if not match:
-                continue
-            remainder = match.group(2).strip()
-            test_name = ""
-            message = remainder
-            if ":" in remainder:
-                potential_test, potential_message = remainder.split(":", 1)
-                if potential_test.strip():
-                    test_name = potential_test.strip()
-                    message = potential_message.strip()
-            elif " - " in remainder:
-                potential_test, potential_message = remainder.split(" - ", 1)
-                test_name = potential_test.strip()
-                message = potential_message.strip()
-            failures.append({"test": test_name, "message": message})
-    return failures
-
-
-def _parse_summary(log_path: Path) -> Optional[Dict[str, int]]:
-    with open(log_path, "r", encoding="utf-8", errors="replace") as log_file:
-        for line in log_file:
-            match = SUMMARY_RE.search(line)
-            if match:
-                passed = int(match.group(1))
-                failed = int(match.group(2))
-                skipped = int(match.group(3))
-                total = passed + failed + skipped
-                return {
-                    "total": total,
-                    "passed": passed,
-                    "failed": failed,
-                    "skipped": skipped,
-                }
-    return None
-
-
-def _parse_results(log_path: Path) -> Tuple[Dict[str, Any], bool]:
-    summary = _parse_summary(log_path)
-    failures = _parse_failures(log_path)
-    parse_error = summary is None
-    if summary is None:
-        summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
-    summary["failures"] = failures
-    return summary, parse_error
+def _parse_failure(remainder: str) -> Dict[str, str]:
+    remainder = remainder.strip()
+    test_name = ""
+    message = remainder
+    if ":" in remainder:
+        potential_test, potential_message = remainder.split(":", 1)
+        if potential_test.strip():
+            test_name = potential_test.strip()
+            message = potential_message.strip()
+    elif " - " in remainder:
+        potential_test, potential_message = remainder.split(" - ", 1)
+        test_name = potential_test.strip()
+        message = potential_message.strip()
+    return {"test": test_name, "message": message}
+
+
+class _ResultCollector:
+    """Collect the automation summary and failures while the log is streamed."""
+
+    def __init__(self) -> None:
+        self.summary: Optional[Dict[str, Any]] = None
+        self.failures: List[Dict[str, str]] = []
+
+    def __call__(self, block: bytes) -> None:
+        for match in RESULT_LINE_RE.finditer(block):
+            if match.lastgroup == "summary":
+                if self.summary is None:
+                    passed, failed, skipped = (int(value) for value in match.group(2, 3, 4))
+                    self.summary = {
+                        "total": passed + failed + skipped,
+                        "passed": passed,
+                        "failed": failed,
+                        "skipped": skipped,
+                    }
+            else:
+                remainder = match.group(6).decode("utf-8", errors="replace")
+                self.failures.append(_parse_failure(remainder))
+
+    def results(self) -> Tuple[Dict[str, Any], bool]:
+        parse_error = self.summary is None
+        summary = dict(self.summary or {"total": 0, "passed": 0, "failed": 0, "skipped": 0})
+        summary["failures"] = self.failures
+        return summary, parse_error
 
 
 def _build_command(config: AutomationSpecsConfig, report_dir: Path) -> List[str]:
@@ -173,9 +208,7 @@ def _parse_payload(payload: Optional[Dict[str, Any]]) -> AutomationSpecsConfig:
         code="ENGINE_NOT_FOUND",
         what="engineRoot",
     )
-    editor_binary = engine_root / "Engine"
-    if not editor_binary.exists():
-        raise ToolError("ENGINE_NOT_FOUND", "engineRoot does not appear to be a valid Unreal Engine installation.")
+    _validate_engine_root(str(engine_root))
 
     uproject = _ensure_path(payload.get("uproject"), code="UPROJECT_NOT_FOUND", what="uproject")
 
@@ -195,8 +228,10 @@ def _parse_payload(payload: Optional[Dict[str, Any]]) -> AutomationSpecsConfig:
     if map_name is not None:
         map_name = str(map_name)
 
-    config = AutomationSpecsConfig(
+    editor_cmd = _resolve_editor_cmd(str(engine_root))
+    return AutomationSpecsConfig(
         engine_root=engine_root,
+        editor_cmd=editor_cmd,
         uproject=uproject,
         tests=tests,
         map_name=map_name,
@@ -206,16 +241,6 @@ def _parse_payload(payload: Optional[Dict[str, Any]]) -> AutomationSpecsConfig:
         env=env,
     )
 
-    editor_cmd = config.editor_cmd
-    if not editor_cmd.exists():
-        raise ToolError(
-            "ENGINE_NOT_FOUND",
-            "UnrealEditor-Cmd executable not found under engineRoot.",
-            {"expected": str(editor_cmd)},
-        )
-
-    return config
-
 
 def run_specs(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """Execute Unreal Automation Tests via UnrealEditor-Cmd."""
@@ -225,18 +250,20 @@ def run_specs(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     except ToolError as exc:
         return exc.to_response()
 
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     log_path = make_log_path("automation", root=LOG_ROOT, timestamp=timestamp)
     report_dir = (REPORT_ROOT / f"report_{timestamp}").expanduser().resolve()
     report_dir.mkdir(parents=True, exist_ok=True)
 
     command = _build_command(config, report_dir)
+    collector = _ResultCollector()
 
     result: ProcessResult = spawn_process(
         command,
         log_path=log_path,
         env=config.env,
         timeout_seconds=config.timeout_seconds,
+        output_scanner=collector,
     )
 
     if result.timed_out:
@@ -253,7 +280,7 @@ def run_specs(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
             {"log": str(result.log_path)},
         ).to_response()
 
-    summary, parse_error = _parse_results(result.log_path)
+    summary, parse_error = collector.results()
     report_xml = _pick_report_xml(report_dir)
 
     response: Dict[str, Any] = {
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import jmespath
 import typer
-import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore
 
 from .logs import configure_logging, get_logger
 from .mcp_client import MCPClient, ProtocolError
@@ -18,6 +22,7 @@ from .recipes import (
     RecipeExecutor,
     load_recipe_file,
     merge_variables,
+    meta_variables,
     render_value,
 )
 from .schema import SchemaError
@@ -30,9 +35,9 @@ app.add_typer(recipe_app, name="recipe")
 def _parse_key_values(pairs: List[str], *, option: str) -> Dict[str, str]:
     values: Dict[str, str] = {}
     for item in pairs:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             raise typer.BadParameter(f"Expected KEY=VALUE format for {option}")
-        key, value = item.split("=", 1)
         if not key:
             raise typer.BadParameter(f"Invalid key for {option}")
         values[key] = value
@@ -50,7 +55,9 @@ def _load_vars_file(path: Optional[Path]) -> Dict[str, Any]:
     try:
         data = json.loads(text)
     except json.JSONDecodeError:
-        data = yaml.safe_load(text)
+        import yaml
+
+        data = yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     if not isinstance(data, dict):
         raise typer.BadParameter("Vars file must contain a mapping")
     return data
@@ -67,7 +74,9 @@ def _load_params_source(params_json: Optional[str], params_file: Optional[Path])
         try:
             payload = json.loads(text)
         except json.JSONDecodeError:
-            payload = yaml.safe_load(text)
+            import yaml
+
+            payload = yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     elif params_json:
         try:
             payload = json.loads(params_json)
@@ -88,14 +97,29 @@ def _format_output(data: Any, *, output: str) -> str:
     if fmt not in {"json", "yaml"}:
         raise typer.BadParameter("--output must be either 'json' or 'yaml'")
     if fmt == "yaml":
-        return yaml.safe_dump(data, sort_keys=False)
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        return yaml.dump(data, Dumper=dumper, sort_keys=False)
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let the stdlib encoder handle them
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_select(expression: str):
+    import jmespath
+
+    return jmespath.compile(expression)
+
+
 def _apply_select(data: Any, select: Optional[str]) -> Any:
     if not select:
         return data
-    return jmespath.search(select, data)
+    return _compile_select(select).search(data)
 
 
 def _configure_and_get_logger(level: str, name: str):
@@ -151,7 +175,7 @@ def run_tool(
         params = dict(params)
         params.setdefault("DryRun", True)
 
-    meta = {"dryRun": dry_run, "vars": variables}
+    meta = {"dryRun": dry_run, "vars": meta_variables(variables)}
     report: Dict[str, Any]
     client = MCPClient(server)
     try:
@@ -257,17 +281,16 @@ def test_recipe(
 
     client = MCPClient(server)
     try:
-        plan_executor = RecipeExecutor(client, loaded, variables=variables)
-        plan = plan_executor.plan()
+        executor = RecipeExecutor(client, loaded, variables=variables)
+        plan = executor.plan()
 
         report: Dict[str, Any] = {
             "recipe": loaded.recipe.name,
             "plan": plan,
-            "vars": variables,
+            "vars": dict(variables),
         }
 
         if dry_run:
-            executor = RecipeExecutor(client, loaded, variables=variables)
             logger.info("Executing dry-run against MCP server %s", server)
             summary = executor.execute(
                 dry_run=True,
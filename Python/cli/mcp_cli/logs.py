@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import IO, Any, Dict, Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore
+
 __all__ = ["configure_logging", "get_logger"]
 
 _DEFAULT_JSONL = Path.home() / ".mcp-cli" / "events.jsonl"
+_JSONL_BUFFER_SIZE = 64 * 1024
+_EXC_FORMATTER = logging.Formatter()
 
 
 class _JsonlHandler(logging.Handler):
@@ -23,6 +31,7 @@ class _JsonlHandler(logging.Handler):
         super().__init__()
         self._path = path
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle: Optional[IO[bytes]] = None
 
     def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - filesystem IO
         payload: Dict[str, Any] = {
@@ -34,10 +43,34 @@ class _JsonlHandler(logging.Handler):
             if hasattr(record, key):
                 payload[key] = getattr(record, key)
         if record.exc_info:
-            payload["exc_info"] = logging.Formatter().formatException(record.exc_info)
-        with self._path.open("a", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False)
-            handle.write("\n")
+            payload["exc_info"] = _EXC_FORMATTER.formatException(record.exc_info)
+        # Called with self.lock held by Handler.handle().
+        if self._handle is None:
+            self._handle = self._path.open("ab", buffering=_JSONL_BUFFER_SIZE)
+        self._handle.write(_encode_line(payload))
+        if record.levelno >= logging.WARNING:
+            self._handle.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._handle is not None:
+                self._handle.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        super().close()
+
+
+def _encode_line(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def _level_from_str(level: str) -> int:
@@ -59,7 +92,9 @@ def configure_logging(level: str = "info", jsonl_path: Optional[Path] = None) ->
     logger = logging.getLogger("mcp_cli")
     logger.setLevel(_level_from_str(level))
     logger.propagate = False
-    logger.handlers.clear()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
 
     console = Console(stderr=True)
     console_handler = RichHandler(
@@ -80,6 +115,7 @@ def configure_logging(level: str = "info", jsonl_path: Optional[Path] = None) ->
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Return a child logger of the CLI root logger."""
 
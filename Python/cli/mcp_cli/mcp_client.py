@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import socket
 import struct
 import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore
+
 from .logs import get_logger
 
 __all__ = ["MCPClient", "ProtocolError"]
@@ -38,7 +45,8 @@ class ProtocolError(RuntimeError):
         }
 
 
-HEADER_SIZE = 4
+_HEADER = struct.Struct("<I")
+HEADER_SIZE = _HEADER.size
 MAX_FRAME_SIZE = 4 * 1024 * 1024
 
 
@@ -49,14 +57,8 @@ class _Endpoint:
 
 
 def _parse_endpoint(server: str) -> _Endpoint:
-    if "//" in server:
-        server = server.split("//", 1)[1]
-    if ":" not in server:
-        host, port = server, 8765
-    else:
-        host, port_str = server.rsplit(":", 1)
-        port = int(port_str)
-    return _Endpoint(host or "127.0.0.1", port)
+    parsed = urlsplit(server if "//" in server else f"tcp://{server}")
+    return _Endpoint(parsed.hostname or "127.0.0.1", parsed.port or 8765)
 
 
 def _monotonic_deadline(timeout: Optional[float]) -> Optional[float]:
@@ -76,68 +78,97 @@ def _remaining_time(deadline: Optional[float]) -> Optional[float]:
     return max(0.0, remaining)
 
 
-def _read_exact(sock: socket.socket, size: int, timeout: Optional[float] = None) -> bytes:
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass  # e.g. non-string keys; the stdlib encoder is more permissive
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_json(payload: bytearray) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode("utf-8"))
+
+
+def _read_exact(sock: socket.socket, size: int, timeout: Optional[float] = None) -> bytearray:
     if size <= 0:
-        return b""
+        return bytearray()
     deadline = _monotonic_deadline(timeout)
-    chunks: list[bytes] = []
-    remaining = size
-    while remaining > 0:
-        chunk_timeout = _remaining_time(deadline)
-        try:
-            sock.settimeout(chunk_timeout)
-            chunk = sock.recv(remaining)
-        except socket.timeout as exc:  # pragma: no cover - depends on OS
-            raise ProtocolError("READ_TIMEOUT", "Timed out while reading from MCP server.") from exc
-        except OSError as exc:  # pragma: no cover - platform specific
-            raise ProtocolError("TRANSPORT_ERROR", f"Socket read failed: {exc}") from exc
-        if not chunk:
-            raise ProtocolError("CONNECTION_CLOSED", "Socket closed while reading frame.")
-        chunks.append(chunk)
-        remaining -= len(chunk)
-    return b"".join(chunks)
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    try:
+        sock.settimeout(timeout)
+        while received < size:
+            count = sock.recv_into(view[received:])
+            if not count:
+                raise ProtocolError("CONNECTION_CLOSED", "Socket closed while reading frame.")
+            received += count
+            if received < size and deadline is not None:
+                # Short read: only the rest of the overall budget is left for the remainder.
+                remaining = _remaining_time(deadline)
+                if not remaining:
+                    raise socket.timeout()
+                sock.settimeout(remaining)
+    except socket.timeout as exc:  # pragma: no cover - depends on OS
+        raise ProtocolError("READ_TIMEOUT", "Timed out while reading from MCP server.") from exc
+    except OSError as exc:  # pragma: no cover - platform specific
+        raise ProtocolError("TRANSPORT_ERROR", f"Socket read failed: {exc}") from exc
+    # Both struct and the JSON decoders accept the buffer directly, so skip a bytes() copy.
+    return buffer
 
 
 def _write_all(sock: socket.socket, payload: bytes, timeout: Optional[float] = None) -> None:
     if not payload:
         return
-    deadline = _monotonic_deadline(timeout)
-    total_sent = 0
-    while total_sent < len(payload):
-        chunk_timeout = _remaining_time(deadline)
-        try:
-            sock.settimeout(chunk_timeout)
-            sent = sock.send(payload[total_sent:])
-        except socket.timeout as exc:  # pragma: no cover - depends on OS
-            raise ProtocolError("WRITE_TIMEOUT", "Timed out while sending frame to MCP server.") from exc
-        except OSError as exc:  # pragma: no cover
-            raise ProtocolError("TRANSPORT_ERROR", f"Socket write failed: {exc}") from exc
-        if sent == 0:
-            raise ProtocolError("CONNECTION_CLOSED", "Socket closed while sending frame.")
-        total_sent += sent
+    try:
+        # sendall loops over short writes in C and treats the timeout as a
+        # budget for the whole payload.
+        sock.settimeout(timeout)
+        sock.sendall(payload)
+    except socket.timeout as exc:  # pragma: no cover - depends on OS
+        raise ProtocolError("WRITE_TIMEOUT", "Timed out while sending frame to MCP server.") from exc
+    except OSError as exc:  # pragma: no cover
+        raise ProtocolError("TRANSPORT_ERROR", f"Socket write failed: {exc}") from exc
+
+
+def _encode_frame(payload: Dict[str, Any]) -> bytes:
+    body = _encode_json(payload)
+    if len(body) > MAX_FRAME_SIZE:
+        raise ProtocolError("FRAME_TOO_LARGE", "Frame exceeds maximum size.", {"length": len(body)})
+    return _HEADER.pack(len(body)) + body
 
 
 def _write_frame(sock: socket.socket, payload: Dict[str, Any], timeout: Optional[float] = None) -> None:
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-    if len(body) > MAX_FRAME_SIZE:
-        raise ProtocolError("FRAME_TOO_LARGE", "Frame exceeds maximum size.", {"length": len(body)})
-    header = struct.pack("<I", len(body))
-    _write_all(sock, header, timeout)
-    _write_all(sock, body, timeout)
+    _write_all(sock, _encode_frame(payload), timeout)
 
 
 def _read_frame(sock: socket.socket, timeout: Optional[float] = None) -> Dict[str, Any]:
     header = _read_exact(sock, HEADER_SIZE, timeout)
-    (length,) = struct.unpack("<I", header)
+    (length,) = _HEADER.unpack(header)
     if length <= 0 or length > MAX_FRAME_SIZE:
         raise ProtocolError("MALFORMED_FRAME", "Invalid frame length.", {"length": length})
     payload = _read_exact(sock, length, timeout)
     try:
-        return json.loads(payload.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        return _decode_json(payload)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ProtocolError("INVALID_JSON", "Received invalid JSON payload.") from exc
 
 
+@functools.lru_cache(maxsize=16)
+def _client_retrying(attempts: int) -> Retrying:
+    # Retrying keeps its per-run state thread-local, so instances can be shared.
+    return Retrying(
+        retry=retry_if_exception_type((ProtocolError, OSError)),
+        stop=stop_after_attempt(attempts),
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=5.0),
+        reraise=True,
+    )
+
+
 class MCPClient:
     """Client capable of sending tool invocations to the MCP server."""
 
@@ -147,11 +178,18 @@ class MCPClient:
         *,
         connect_timeout: float = 5.0,
         read_timeout: float = 120.0,
+        tcp_nodelay: bool = True,
+        send_buffer_size: Optional[int] = None,
+        recv_buffer_size: Optional[int] = None,
     ) -> None:
         self._endpoint = _parse_endpoint(server)
         self._connect_timeout = connect_timeout
         self._read_timeout = read_timeout
+        self._tcp_nodelay = tcp_nodelay
+        self._send_buffer_size = send_buffer_size
+        self._recv_buffer_size = recv_buffer_size
         self._sock: Optional[socket.socket] = None
+        self._addrinfo: Optional[List[Tuple[Any, ...]]] = None
         self._session_id = str(uuid.uuid4())
         self._handshake_ok = False
 
@@ -162,7 +200,7 @@ class MCPClient:
     def connect(self) -> Dict[str, Any]:
         if self._sock:
             self.close()
-        sock = socket.create_connection((self._endpoint.host, self._endpoint.port), timeout=self._connect_timeout)
+        sock = self._open_socket()
         sock.settimeout(None)
         self._sock = sock
         handshake = {
@@ -179,6 +217,37 @@ class MCPClient:
         logger.debug("Handshake accepted: %s", ack)
         return ack
 
+    def _open_socket(self) -> socket.socket:
+        # Resolve once and reuse the addresses on reconnect; like
+        # socket.create_connection, try each address in turn.
+        if self._addrinfo is None:
+            self._addrinfo = socket.getaddrinfo(self._endpoint.host, self._endpoint.port, 0, socket.SOCK_STREAM)
+        error: Optional[OSError] = None
+        for family, sock_type, proto, _, sockaddr in self._addrinfo:
+            sock = socket.socket(family, sock_type, proto)
+            try:
+                sock.settimeout(self._connect_timeout)
+                self._configure_socket(sock)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as exc:
+                sock.close()
+                error = exc
+        # None of the cached addresses worked; resolve again next time.
+        self._addrinfo = None
+        raise error or OSError(f"No addresses found for {self._endpoint.host}:{self._endpoint.port}")
+
+    def _configure_socket(self, sock: socket.socket) -> None:
+        # Frames are small request/response pairs; don't let Nagle hold them back.
+        if self._tcp_nodelay:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Applied before connecting so the receive window is negotiated with them.
+        # Buffer sizes are left to kernel autotuning unless explicitly requested.
+        if self._send_buffer_size:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._send_buffer_size)
+        if self._recv_buffer_size:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._recv_buffer_size)
+
     def close(self) -> None:
         if self._sock:
             try:
@@ -208,9 +277,15 @@ class MCPClient:
             "meta": meta or {},
         }
         attempt_timeout = timeout or self._read_timeout
-        _write_frame(self._sock, payload, timeout=self._connect_timeout)
-        response = _read_frame(self._sock, timeout=attempt_timeout)
-        return response
+        frame = _encode_frame(payload)
+        try:
+            _write_all(self._sock, frame, timeout=self._connect_timeout)
+            return _read_frame(self._sock, timeout=attempt_timeout)
+        except (ProtocolError, OSError):
+            # Part of the exchange may still be in flight, so a late response
+            # could be read as the answer to the next call; start over instead.
+            self.close()
+            raise
 
     def call_with_retry(
         self,
@@ -222,22 +297,12 @@ class MCPClient:
         timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         def _invoke() -> Dict[str, Any]:
-            try:
-                return self.call_tool(tool, params, meta=meta, timeout=timeout)
-            except (ProtocolError, OSError):
-                self.close()
-                raise
+            return self.call_tool(tool, params, meta=meta, timeout=timeout)
 
         if attempts <= 1:
             return _invoke()
 
-        retry = Retrying(
-            retry=retry_if_exception_type((ProtocolError, OSError)),
-            stop=stop_after_attempt(attempts),
-            wait=wait_exponential(multiplier=0.5, min=0.5, max=5.0),
-            reraise=True,
-        )
-        for attempt in retry:
+        for attempt in _client_retrying(attempts):
             with attempt:
                 return _invoke()
         raise AssertionError("tenacity did not return a result")
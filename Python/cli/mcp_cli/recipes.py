@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import time
+from collections import ChainMap
 from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
-import jmespath
-import yaml
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential, wait_random
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore
+
 from .logs import get_logger
 from .mcp_client import MCPClient, ProtocolError
 from .schema import SchemaError, StepSpec, ValidatedRecipe, select_recipe, validate_recipe
@@ -24,6 +29,7 @@ __all__ = [
     "RecipeExecutor",
     "load_recipe_file",
     "merge_variables",
+    "meta_variables",
     "render_value",
 ]
 
@@ -51,8 +57,10 @@ def load_recipe_file(path: Path, recipe_name: Optional[str] = None) -> LoadedRec
     resolved_path = path.resolve()
     if not resolved_path.exists():
         raise FileNotFoundError(f"Recipe file not found: {resolved_path}")
+    import yaml
+
     with resolved_path.open("r", encoding="utf-8") as handle:
-        document = yaml.safe_load(handle) or {}
+        document = yaml.load(handle, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
     if not isinstance(document, dict):
         raise SchemaError("Recipe file must contain a mapping at the top level")
     name, recipe_body = select_recipe(document, recipe_name=recipe_name)
@@ -64,26 +72,41 @@ def merge_variables(
     recipe_vars: Dict[str, str],
     cli_vars: Dict[str, str],
     file_vars: Dict[str, Any],
-) -> Dict[str, Any]:
-    merged: Dict[str, Any] = {key: value for key, value in os.environ.items()}
-    merged.update(recipe_vars)
-    merged.update(file_vars)
-    merged.update(cli_vars)
-    return merged
+) -> ChainMap[str, Any]:
+    """Layer variables by precedence: CLI, vars file, recipe, then the environment.
+
+    The environment is consulted live rather than copied.
+    """
+
+    return ChainMap(cli_vars, file_vars, recipe_vars, os.environ)
+
+
+def meta_variables(variables: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the variables sent along with tool calls.
+
+    For mappings built by ``merge_variables`` the process environment layer is
+    left out, so requests only carry explicitly provided variables.
+    """
+
+    if isinstance(variables, ChainMap):
+        variables = ChainMap(*(layer for layer in variables.maps if layer is not os.environ))
+    return {key: value for key, value in variables.items() if isinstance(key, str)}
 
 
 _ENV_PATTERN = re.compile(r"\$\{([^{}]+)\}")
 _STEP_PATTERN = re.compile(r"\$\{\{([^{}]+)\}\}")
 
 
-def _resolve_env_expression(expr: str, variables: Dict[str, Any]) -> str:
+@functools.lru_cache(maxsize=4096)
+def _parse_env_expression(expr: str) -> Tuple[str, Optional[str]]:
     if ":-" in expr:
         key, default = expr.split(":-", 1)
-        key = key.strip()
-        default_value = default
-    else:
-        key, default_value = expr, None
-    key = key.strip()
+        return key.strip(), default
+    return expr.strip(), None
+
+
+def _resolve_env_expression(expr: str, variables: Dict[str, Any]) -> str:
+    key, default_value = _parse_env_expression(expr)
     if key in variables and variables[key] is not None:
         return str(variables[key])
     if key in os.environ:
@@ -94,6 +117,9 @@ def _resolve_env_expression(expr: str, variables: Dict[str, Any]) -> str:
 
 
 def _replace_env_strings(value: str, variables: Dict[str, Any]) -> str:
+    if "${" not in value:
+        return value
+
     def repl(match: re.Match[str]) -> str:
         expr = match.group(1)
         return _resolve_env_expression(expr, variables)
@@ -101,16 +127,41 @@ def _replace_env_strings(value: str, variables: Dict[str, Any]) -> str:
     return _ENV_PATTERN.sub(repl, value)
 
 
+@functools.lru_cache(maxsize=512)
+def _compile_expression(expression: str):
+    import jmespath
+
+    return jmespath.compile(expression)
+
+
+def _iter_step_expressions(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if "${{" in value:
+            for expression in _STEP_PATTERN.findall(value):
+                yield expression.strip()
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_step_expressions(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_step_expressions(item)
+
+
 def _replace_step_references(value: str, context: Dict[str, Any]) -> str:
+    if "${{" not in value:
+        return value
+
     def repl(match: re.Match[str]) -> str:
         expression = match.group(1).strip()
         try:
-            result = jmespath.search(expression, context)
+            result = _compile_expression(expression).search(context)
         except Exception as exc:
             raise SchemaError(f"Failed to evaluate expression '{expression}': {exc}") from exc
         if result is None:
             return ""
         if isinstance(result, (dict, list)):
+            if orjson is not None:
+                return orjson.dumps(result).decode("utf-8")
             return json.dumps(result)
         return str(result)
 
@@ -118,14 +169,28 @@ def _replace_step_references(value: str, context: Dict[str, Any]) -> str:
 
 
 def render_value(value: Any, variables: Dict[str, Any], context: Dict[str, Any]) -> Any:
+    """Render templates in ``value``.
+
+    Containers without any templated leaves are returned as-is rather than
+    copied, so callers must copy before mutating the result.
+    """
+
     if isinstance(value, str):
+        if "${" not in value:
+            return value
         replaced = _replace_step_references(value, context)
         replaced = _replace_env_strings(replaced, variables)
         return replaced
     if isinstance(value, list):
-        return [render_value(item, variables, context) for item in value]
+        rendered_items = [render_value(item, variables, context) for item in value]
+        if all(new is old for new, old in zip(rendered_items, value)):
+            return value
+        return rendered_items
     if isinstance(value, dict):
-        return {key: render_value(val, variables, context) for key, val in value.items()}
+        rendered_map = {key: render_value(val, variables, context) for key, val in value.items()}
+        if all(rendered_map[key] is val for key, val in value.items()):
+            return value
+        return rendered_map
     return value
 
 
@@ -138,7 +203,9 @@ def _load_params_from_file(base_dir: Path, file_path: str) -> Dict[str, Any]:
     try:
         return json.loads(text)
     except json.JSONDecodeError:
-        return yaml.safe_load(text)
+        import yaml
+
+        return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
 
 def _evaluate_condition(value: Any, variables: Dict[str, Any], context: Dict[str, Any]) -> bool:
@@ -159,8 +226,7 @@ def _evaluate_condition(value: Any, variables: Dict[str, Any], context: Dict[str
     return bool(evaluated)
 
 
-def _step_retry_config(step_raw: dict, default_attempts: int) -> Tuple[int, float, float]:
-    retry_cfg = step_raw.get("retry")
+def _step_retry_config(retry_cfg: Any, default_attempts: int) -> Tuple[int, float, float]:
     attempts = default_attempts
     backoff = 1.0
     jitter = 0.0
@@ -177,6 +243,21 @@ def _step_retry_config(step_raw: dict, default_attempts: int) -> Tuple[int, floa
     return attempts, backoff, jitter
 
 
+@functools.lru_cache(maxsize=64)
+def _step_retrying(attempts: int, backoff: float, jitter: float) -> Retrying:
+    # Retrying keeps its per-run state thread-local, so one instance can be
+    # shared by every step (and worker thread) using the same settings.
+    waits = wait_exponential(multiplier=backoff, min=backoff, max=max(backoff * 4, backoff))
+    if jitter > 0:
+        waits = waits + wait_random(0, jitter)
+    return Retrying(
+        retry=retry_if_exception_type((ProtocolError, OSError)),
+        stop=stop_after_attempt(attempts),
+        wait=waits,
+        reraise=True,
+    )
+
+
 class RecipeExecutor:
     def __init__(
         self,
@@ -188,17 +269,41 @@ class RecipeExecutor:
         self.client = client
         self.loaded = loaded
         self.variables = variables
-        self.context: Dict[str, Any] = {"steps": {}, "vars": variables}
+        # Shared by every step's meta payload; variables are not modified during a run.
+        self._meta_vars = meta_variables(variables)
+        # Expressions see a plain dict of the explicit layers only; the environment
+        # stays reachable through ``${VAR}`` interpolation.
+        self.context: Dict[str, Any] = {"steps": {}, "vars": self._meta_vars}
         self.base_dir = loaded.source_path.parent
         self._step_map: Dict[str, StepSpec] = {step.name: step for step in loaded.recipe.steps}
+        self._precompile_expressions()
+
+    def _precompile_expressions(self) -> None:
+        for step in self.loaded.recipe.steps:
+            sources = [step.params, step.params_file, step.when]
+            for expression in _iter_step_expressions(sources):
+                try:
+                    _compile_expression(expression)
+                except Exception:
+                    # Reported with step context when the expression is rendered.
+                    continue
 
     def plan(self) -> List[str]:
+        if self.loaded.recipe.order:
+            return list(self.loaded.recipe.order)
+        return list(self._step_sorter().static_order())
+
+    def _step_sorter(self):
         from graphlib import TopologicalSorter
 
         sorter = TopologicalSorter()
+        # Register every step first so ready steps come out in declaration order,
+        # the same order validate_recipe computes for plan().
+        for step in self.loaded.recipe.steps:
+            sorter.add(step.name)
         for step in self.loaded.recipe.steps:
             sorter.add(step.name, *step.needs)
-        return list(sorter.static_order())
+        return sorter
 
     def execute(
         self,
@@ -210,29 +315,59 @@ class RecipeExecutor:
         default_timeout: Optional[float] = None,
         allow_save: bool = True,
     ) -> Dict[str, Any]:
-        from graphlib import TopologicalSorter
-
-        sorter = TopologicalSorter()
-        for step in self.loaded.recipe.steps:
-            sorter.add(step.name, *step.needs)
+        sorter = self._step_sorter()
         sorter.prepare()
 
-        executor = ThreadPoolExecutor(max_workers=max(1, parallelism))
+        # With a single worker, steps run inline; a pool would only add thread
+        # hand-offs and Future bookkeeping per step.
+        executor = ThreadPoolExecutor(max_workers=parallelism) if parallelism > 1 else None
         futures: Dict[Future[StepResult], str] = {}
         results: Dict[str, StepResult] = {}
         failed = False
         audit_actions: List[Any] = []
         audit_diffs: List[Any] = []
 
+        def finish(name: str, step_result: StepResult) -> bool:
+            """Record a finished step; return True if execution should abort."""
+
+            nonlocal failed
+            results[name] = step_result
+            self.context["steps"][name] = {
+                "ok": step_result.ok,
+                "skipped": step_result.skipped,
+                "result": step_result.response,
+            }
+            sorter.done(name)
+            if not step_result.ok and not step_result.skipped:
+                failed = True
+                if not continue_on_error:
+                    logger.error("Step %s failed; aborting remaining steps", name)
+                    return True
+                logger.warning("Continuing despite failure in %s", name)
+            audit = step_result.response.get("audit") if isinstance(step_result.response, dict) else None
+            if isinstance(audit, dict):
+                actions = audit.get("actions")
+                if isinstance(actions, list):
+                    audit_actions.extend(actions)
+                diffs = audit.get("diffs")
+                if isinstance(diffs, list):
+                    audit_diffs.extend(diffs)
+            return False
+
+        def internal_error(name: str, exc: Exception) -> StepResult:
+            logger.exception("Step %s raised an unexpected error", name)
+            return StepResult(name=name, ok=False, response={"ok": False, "error": {"code": "INTERNAL_ERROR", "message": str(exc)}}, duration=0.0)
+
         try:
-            while True:
+            abort = False
+            while not abort:
                 ready = list(sorter.get_ready())
                 if not ready and not futures:
                     break
                 for name in ready:
                     step_spec = self._step_map[name]
                     step_context = self.context
-                    condition = _evaluate_condition(step_spec.raw.get("when"), self.variables, step_context)
+                    condition = _evaluate_condition(step_spec.when, self.variables, step_context)
                     if not condition:
                         logger.info("Skipping step %s (condition false)", name)
                         result = StepResult(name=name, ok=True, response={}, duration=0.0, skipped=True)
@@ -250,9 +385,23 @@ class RecipeExecutor:
                         sorter.done(name)
                         continue
 
+                    if executor is None:
+                        try:
+                            step_result = self._run_step(step_spec, step_context, dry_run, default_retry, default_timeout, allow_save)
+                        except Exception as exc:  # pragma: no cover - defensive
+                            step_result = internal_error(name, exc)
+                        if finish(name, step_result):
+                            abort = True
+                            break
+                        continue
+
+                    # Workers render against a snapshot taken when the step became
+                    # ready; the live context keeps changing as other steps finish.
+                    step_snapshot = {**step_context, "steps": dict(step_context["steps"])}
                     future = executor.submit(
                         self._run_step,
                         step_spec,
+                        step_snapshot,
                         dry_run,
                         default_retry,
                         default_timeout,
@@ -264,43 +413,21 @@ class RecipeExecutor:
                     continue
 
                 done, _ = wait(futures.keys(), return_when=FIRST_COMPLETED)
-                abort = False
                 for future in done:
                     name = futures.pop(future)
                     try:
                         step_result = future.result()
                     except Exception as exc:  # pragma: no cover - defensive
-                        logger.exception("Step %s raised an unexpected error", name)
-                        step_result = StepResult(name=name, ok=False, response={"ok": False, "error": {"code": "INTERNAL_ERROR", "message": str(exc)}}, duration=0.0)
-                    results[name] = step_result
-                    self.context["steps"][name] = {
-                        "ok": step_result.ok,
-                        "skipped": step_result.skipped,
-                        "result": step_result.response,
-                    }
-                    sorter.done(name)
-                    if not step_result.ok and not step_result.skipped:
-                        failed = True
-                        if not continue_on_error:
-                            logger.error("Step %s failed; aborting remaining steps", name)
-                            for pending in futures:
-                                pending.cancel()
-                            futures.clear()
-                            abort = True
-                            break
-                        logger.warning("Continuing despite failure in %s", name)
-                    audit = step_result.response.get("audit") if isinstance(step_result.response, dict) else None
-                    if isinstance(audit, dict):
-                        actions = audit.get("actions")
-                        if isinstance(actions, list):
-                            audit_actions.extend(actions)
-                        diffs = audit.get("diffs")
-                        if isinstance(diffs, list):
-                            audit_diffs.extend(diffs)
-                if abort:
-                    break
+                        step_result = internal_error(name, exc)
+                    if finish(name, step_result):
+                        for pending in futures:
+                            pending.cancel()
+                        futures.clear()
+                        abort = True
+                        break
         finally:
-            executor.shutdown(wait=True)
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         for name in self._step_map:
             if name not in results:
@@ -329,6 +456,7 @@ class RecipeExecutor:
     def _run_step(
         self,
         step: StepSpec,
+        context: Dict[str, Any],
         dry_run: bool,
         default_retry: int,
         default_timeout: Optional[float],
@@ -337,27 +465,27 @@ class RecipeExecutor:
         params: Any = step.params
         path_value = step.params_file
         if path_value:
-            rendered_path = render_value(path_value, self.variables, self.context)
+            rendered_path = render_value(path_value, self.variables, context)
             if not isinstance(rendered_path, str):
                 raise SchemaError(f"Step {step.name} params_file must resolve to a string path")
             params = _load_params_from_file(self.base_dir, rendered_path)
-        params = render_value(params, self.variables, self.context) if params is not None else {}
+        params = render_value(params, self.variables, context) if params is not None else {}
         if dry_run and isinstance(params, dict) and "DryRun" not in params:
             params = dict(params)
             params.setdefault("DryRun", True)
         meta = {
             "step": step.name,
             "dryRun": dry_run,
-            "vars": {k: v for k, v in self.variables.items() if isinstance(k, str)},
+            "vars": self._meta_vars,
         }
         timeout = default_timeout
-        timeout_raw = step.raw.get("timeout_sec")
+        timeout_raw = step.timeout_sec
         if isinstance(timeout_raw, (int, float)) and timeout_raw > 0:
             timeout = float(timeout_raw)
 
-        attempts, backoff, jitter = _step_retry_config(step.raw, default_retry)
+        attempts, backoff, jitter = _step_retry_config(step.retry, default_retry)
 
-        start = time.time()
+        start = time.monotonic()
 
         def invoke() -> Dict[str, Any]:
             return self.client.call_tool(step.tool, params, meta=meta, timeout=timeout)
@@ -366,32 +494,25 @@ class RecipeExecutor:
             if attempts <= 1:
                 response = invoke()
             else:
-                waits = wait_exponential(multiplier=backoff, min=backoff, max=max(backoff * 4, backoff))
-                if jitter > 0:
-                    waits = waits + wait_random(0, jitter)
-                retry = Retrying(
-                    retry=retry_if_exception_type((ProtocolError, OSError)),
-                    stop=stop_after_attempt(attempts),
-                    wait=waits,
-                    reraise=True,
-                )
-                for attempt in retry:
+                for attempt in _step_retrying(attempts, backoff, jitter):
                     with attempt:
                         response = invoke()
                         break
-            duration = time.time() - start
+            duration = time.monotonic() - start
             ok = bool(response.get("ok", False)) if isinstance(response, dict) else False
             saved_path = None
-            save_as = step.raw.get("save_as")
+            save_as = step.save_as
             if allow_save and isinstance(save_as, str):
                 save_path = (self.base_dir / save_as).resolve()
                 save_path.parent.mkdir(parents=True, exist_ok=True)
-                with save_path.open("w", encoding="utf-8") as handle:
-                    json.dump(response, handle, indent=2)
+                if orjson is not None:
+                    save_path.write_bytes(orjson.dumps(response, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    save_path.write_text(json.dumps(response, indent=2), encoding="utf-8")
                 saved_path = save_path
             return StepResult(name=step.name, ok=ok, response=response, duration=duration, saved_path=saved_path)
         except Exception as exc:
-            duration = time.time() - start
+            duration = time.monotonic() - start
             logger.error("Step %s raised exception: %s", step.name, exc)
             return StepResult(
                 name=step.name,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Set
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 __all__ = ["SchemaError", "ValidatedRecipe", "StepSpec", "validate_recipe", "select_recipe"]
 
@@ -12,56 +13,62 @@ class SchemaError(ValueError):
     """Raised when the recipe definition is invalid."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StepSpec:
     name: str
     tool: str
     params: Optional[dict]
     params_file: Optional[str]
     needs: List[str]
-    raw: dict
+    # Optional keys read by the executor; left unvalidated here as before.
+    when: Any = None
+    timeout_sec: Any = None
+    retry: Any = None
+    save_as: Any = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidatedRecipe:
     name: str
     version: int
     steps: List[StepSpec]
     vars: Dict[str, str]
+    order: List[str] = field(default_factory=list)
 
 
-def _ensure_unique_steps(steps: Iterable[StepSpec]) -> None:
-    seen: Set[str] = set()
-    for step in steps:
-        if step.name in seen:
-            raise SchemaError(f"Duplicate step name: {step.name}")
-        seen.add(step.name)
+def _order_steps(steps: List[StepSpec]) -> List[str]:
+    """Validate step names and dependencies, returning a topological order.
 
+    Uses Kahn's algorithm so deep recipes cannot hit the recursion limit.
+    """
 
-def _validate_dependencies(steps: List[StepSpec]) -> None:
-    step_names = {step.name for step in steps}
+    indegree: Dict[str, int] = {}
+    dependents: Dict[str, List[str]] = {}
+    for step in steps:
+        if step.name in indegree:
+            raise SchemaError(f"Duplicate step name: {step.name}")
+        indegree[step.name] = len(step.needs)
+        dependents[step.name] = []
     for step in steps:
         for dep in step.needs:
-            if dep not in step_names:
+            if dep not in dependents:
                 raise SchemaError(f"Step '{step.name}' depends on unknown step '{dep}'")
-    # Simple cycle detection using DFS
-    graph = {step.name: set(step.needs) for step in steps}
-    visiting: Set[str] = set()
-    visited: Set[str] = set()
-
-    def dfs(node: str) -> None:
-        if node in visiting:
-            raise SchemaError(f"Cycle detected involving step '{node}'")
-        if node in visited:
-            return
-        visiting.add(node)
-        for neighbor in graph[node]:
-            dfs(neighbor)
-        visiting.remove(node)
-        visited.add(node)
+            dependents[dep].append(step.name)
 
-    for step in steps:
-        dfs(step.name)
+    queue = deque(name for name, count in indegree.items() if count == 0)
+    order: List[str] = []
+    while queue:
+        name = queue.popleft()
+        order.append(name)
+        for dependent in dependents[name]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                queue.append(dependent)
+
+    if len(order) != len(steps):
+        remaining = [name for name, count in indegree.items() if count > 0]
+        raise SchemaError(f"Cycle detected involving steps: {', '.join(remaining)}")
+    return order
 
 
 def validate_recipe(recipe: dict, *, name: str = "default") -> ValidatedRecipe:
@@ -101,10 +108,21 @@ def validate_recipe(recipe: dict, *, name: str = "default") -> ValidatedRecipe:
             needs = list(needs_raw)
         else:
             raise SchemaError(f"Step '{step_name}' needs must be a list of step names")
-        steps.append(StepSpec(step_name, tool_name, params, params_file, needs, dict(item)))
-
-    _ensure_unique_steps(steps)
-    _validate_dependencies(steps)
+        steps.append(
+            StepSpec(
+                step_name,
+                tool_name,
+                params,
+                params_file,
+                needs,
+                when=item.get("when"),
+                timeout_sec=item.get("timeout_sec"),
+                retry=item.get("retry"),
+                save_as=item.get("save_as"),
+            )
+        )
+
+    order = _order_steps(steps)
 
     vars_section = recipe.get("vars", {})
     if not isinstance(vars_section, dict):
@@ -115,7 +133,7 @@ def validate_recipe(recipe: dict, *, name: str = "default") -> ValidatedRecipe:
             raise SchemaError("Recipe variable names must be strings")
         cast_vars[key] = str(value)
 
-    return ValidatedRecipe(name=name, version=version, steps=steps, vars=cast_vars)
+    return ValidatedRecipe(name=name, version=version, steps=steps, vars=cast_vars, order=order)
 
 
 def select_recipe(document: dict, *, recipe_name: Optional[str] = None) -> tuple[str, dict]:
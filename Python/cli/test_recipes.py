@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_cli.recipes import LoadedRecipe, RecipeExecutor, merge_variables, render_value
+from mcp_cli.schema import validate_recipe
+
+
+def make_executor(monkeypatch, recipe_vars=None, cli_vars=None, file_vars=None) -> RecipeExecutor:
+    monkeypatch.setenv("MCP_TEST_SECRET", "hunter2")
+    recipe = validate_recipe(
+        {"version": 1, "vars": recipe_vars or {}, "steps": [{"name": "a", "tool": "t", "params": {}}]}
+    )
+    loaded = LoadedRecipe(recipe=recipe, source_path=Path("recipe.yaml").resolve(), document={})
+    variables = merge_variables(recipe.vars, cli_vars or {}, file_vars or {})
+    return RecipeExecutor(None, loaded, variables=variables)
+
+
+def render(executor: RecipeExecutor, value):
+    return render_value(value, executor.variables, executor.context)
+
+
+def test_step_expression_reads_single_var(monkeypatch):
+    executor = make_executor(monkeypatch, recipe_vars={"Map": "recipe"}, cli_vars={"Map": "cli"})
+    assert render(executor, "${{ vars.Map }}") == "cli"
+
+
+def test_step_expression_vars_excludes_environment(monkeypatch):
+    executor = make_executor(monkeypatch, recipe_vars={"A": "1"}, file_vars={"B": 2})
+    rendered = render(executor, "${{ vars }}")
+    assert json.loads(rendered) == {"A": "1", "B": 2}
+    assert "hunter2" not in rendered
+
+
+def test_step_expression_keys_of_vars(monkeypatch):
+    executor = make_executor(monkeypatch, recipe_vars={"A": "1"}, cli_vars={"C": "3"})
+    assert sorted(json.loads(render(executor, "${{ keys(vars) }}"))) == ["A", "C"]
+    assert render(executor, "${{ length(vars) }}") == "2"
+
+
+def test_env_interpolation_still_falls_back_to_environment(monkeypatch):
+    executor = make_executor(monkeypatch, recipe_vars={"A": "1"})
+    assert render(executor, "${A}-${MCP_TEST_SECRET}") == "1-hunter2"
+    assert render(executor, "${MCP_TEST_MISSING:-dflt}") == "dflt"
+
+
+def test_env_interpolation_prefers_explicit_vars(monkeypatch):
+    executor = make_executor(monkeypatch, cli_vars={"MCP_TEST_SECRET": "override"})
+    assert render(executor, "${MCP_TEST_SECRET}") == "override"
+
+
+def test_template_free_values_are_returned_unchanged(monkeypatch):
+    executor = make_executor(monkeypatch)
+    params = {"a": [1, "plain"], "b": {"c": "x"}}
+    assert render(executor, params) is params
+
+
+@pytest.mark.parametrize("expression", ["${{ vars.Missing }}", "${{ steps.a.result }}"])
+def test_missing_references_render_empty(monkeypatch, expression):
+    executor = make_executor(monkeypatch)
+    assert render(executor, expression) == ""
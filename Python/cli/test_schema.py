@@ -0,0 +1,111 @@
+import dataclasses
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from mcp_cli.recipes import LoadedRecipe, RecipeExecutor
+from mcp_cli.schema import SchemaError, validate_recipe
+
+
+def recipe(*steps: Dict[str, Any]) -> Dict[str, Any]:
+    return {"version": 1, "steps": [{"tool": "t", "params": {}, **step} for step in steps]}
+
+
+def order_of(*steps: Dict[str, Any]) -> List[str]:
+    return validate_recipe(recipe(*steps)).order
+
+
+class RecordingClient:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def call_tool(self, tool, params, *, meta=None, timeout=None) -> Dict[str, Any]:
+        self.calls.append(meta["step"])
+        return {"ok": True}
+
+
+def test_dependencies_come_before_dependents():
+    order = order_of(
+        {"name": "package", "needs": ["cook", "build"]},
+        {"name": "cook", "needs": ["build"]},
+        {"name": "build"},
+    )
+    assert order == ["build", "cook", "package"]
+
+
+def test_independent_steps_keep_declaration_order():
+    assert order_of({"name": "c"}, {"name": "a"}, {"name": "b"}) == ["c", "a", "b"]
+    assert order_of({"name": "x", "needs": ["z"]}, {"name": "y"}, {"name": "z"}) == ["y", "z", "x"]
+
+
+def test_diamond_dependencies():
+    order = order_of(
+        {"name": "root"},
+        {"name": "left", "needs": ["root"]},
+        {"name": "right", "needs": ["root"]},
+        {"name": "join", "needs": ["right", "left"]},
+    )
+    assert order == ["root", "left", "right", "join"]
+
+
+def test_repeated_dependency_is_counted_once_per_mention():
+    assert order_of({"name": "b", "needs": ["a", "a"]}, {"name": "a"}) == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    "steps, involved",
+    [
+        (({"name": "a", "needs": ["a"]},), "a"),
+        (({"name": "a", "needs": ["b"]}, {"name": "b", "needs": ["a"]}), "a, b"),
+        (
+            ({"name": "ok"}, {"name": "a", "needs": ["ok", "c"]}, {"name": "b", "needs": ["a"]}, {"name": "c", "needs": ["b"]}),
+            "a, b, c",
+        ),
+    ],
+)
+def test_cycles_are_rejected(steps, involved):
+    with pytest.raises(SchemaError) as exc:
+        order_of(*steps)
+    assert str(exc.value) == f"Cycle detected involving steps: {involved}"
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(SchemaError, match="unknown step 'missing'"):
+        order_of({"name": "a", "needs": ["missing"]})
+
+
+def test_duplicate_step_names_are_rejected():
+    with pytest.raises(SchemaError, match="Duplicate step name: a"):
+        order_of({"name": "a"}, {"name": "a"})
+
+
+def test_deep_chain_does_not_recurse():
+    depth = 5000
+    steps = [{"name": "s0"}] + [{"name": f"s{index}", "needs": [f"s{index - 1}"]} for index in range(1, depth)]
+    assert order_of(*reversed(steps)) == [f"s{index}" for index in range(depth)]
+
+
+def test_validated_recipe_is_frozen():
+    validated = validate_recipe(recipe({"name": "a"}))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        validated.order = []  # type: ignore[misc]
+
+
+def test_sequential_execution_follows_the_plan():
+    validated = validate_recipe(
+        recipe(
+            {"name": "x", "needs": ["z"]},
+            {"name": "y"},
+            {"name": "z"},
+            {"name": "w", "needs": ["y"]},
+            {"name": "v", "needs": ["z"]},
+        )
+    )
+    loaded = LoadedRecipe(recipe=validated, source_path=Path("recipe.yaml").resolve(), document={})
+    client = RecordingClient()
+    executor = RecipeExecutor(client, loaded, variables={})
+
+    summary = executor.execute()
+    assert summary["ok"]
+    assert client.calls == executor.plan() == validated.order == ["y", "z", "w", "x", "v"]
@@ -1,11 +1,61 @@
 from __future__ import annotations
 
+import heapq
 import json
+import mmap
+import os
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import BinaryIO, Dict, Iterator, List, Optional, Any, Tuple
+
+
+_COMPACT_FACTOR = 4
+# The expiry heap is rebuilt from the live entries once it holds this many times max_entries.
+_HEAP_SLACK_FACTOR = 2
+_FLUSH_EVERY = 64
+_TS_KEY = b'"ts":'
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _journal_line(request_id: str, timestamp: float, response: Dict[str, Any]) -> str:
+    # "ts" precedes "response" so _peek_timestamp finds the top-level key first.
+    payload = {"requestId": request_id, "ts": timestamp, "response": response}
+    return _encode_json(payload) + "\n"
+
+
+def _peek_timestamp(line: bytes) -> Optional[float]:
+    """Read a journal line's timestamp without decoding the whole line."""
+
+    start = line.find(_TS_KEY)
+    if start < 0:
+        return None
+    start += len(_TS_KEY)
+    end = line.find(b",", start)
+    try:
+        return float(line[start:end] if end >= 0 else line[start:])
+    except ValueError:
+        return None
+
+
+def _iter_journal_lines(handle: BinaryIO) -> Iterator[bytes]:
+    """Yield the non-blank lines of a journal file, mapping it instead of reading it."""
+
+    if os.fstat(handle.fileno()).st_size == 0:
+        return
+    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        pos = 0
+        end = len(mapped)
+        while pos < end:
+            newline = mapped.find(b"\n", pos)
+            if newline < 0:
+                newline = end
+            line = mapped[pos:newline].strip()
+            pos = newline + 1
+            if line:
+                yield line
 
 
 @dataclass
@@ -26,8 +76,18 @@ class DedupStore:
         self.ttl_sec = ttl_sec
         self.max_entries = max_entries
         self._lock = threading.Lock()
-        self._entries: Dict[str, _DedupEntry] = {}
+        # Ordered from least to most recently used, so eviction pops from the front.
+        self._entries: "OrderedDict[str, _DedupEntry]" = OrderedDict()
+        # (timestamp, request_id) pairs for TTL expiry. Pairs for replaced or evicted keys are
+        # skipped when popped and dropped wholesale once the heap outgrows the entries.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Expired entries are swept at most once per ttl/16 (monotonic clock).
+        self._last_gc = float("-inf")
         self.journal_path = journal_path or Path("logs/dedup.jsonl")
+        self._journal_lines = 0
+        # Append handle kept open across puts; flushed every _FLUSH_EVERY lines and on close().
+        self._journal_handle: Optional[BinaryIO] = None
+        self._unflushed = 0
         self._load_journal()
 
     def _load_journal(self) -> None:
@@ -35,15 +95,22 @@ class DedupStore:
             return
 
         now = time.time()
+        lines = 0
         try:
-            with self.journal_path.open("r", encoding="utf-8") as handle:
-                for line in handle:
-                    line = line.strip()
-                    if not line:
+            with self.journal_path.open("rb") as handle:
+                for line in _iter_journal_lines(handle):
+                    lines += 1
+
+                    # Skip expired lines before paying for a full JSON decode.
+                    ts_hint = _peek_timestamp(line)
+                    if ts_hint is not None and now - ts_hint > self.ttl_sec:
                         continue
+
                     try:
                         payload = json.loads(line)
-                    except json.JSONDecodeError:
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    if not isinstance(payload, dict):
                         continue
 
                     request_id = payload.get("requestId")
@@ -57,55 +124,116 @@ class DedupStore:
                         continue
 
                     self._entries[request_id] = _DedupEntry(ts, response)
-        except OSError:
+                    self._entries.move_to_end(request_id)
+        except (OSError, ValueError):
             # If we fail to read the journal we simply start with an empty store.
             self._entries.clear()
+            return
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._rebuild_expiry_heap_locked()
 
-    def _append_journal(self, request_id: str, response: Dict[str, Any]) -> None:
+        self._journal_lines = lines
+        if lines > _COMPACT_FACTOR * self.max_entries:
+            self._compact_journal_locked()
+
+    def _append_journal(self, request_id: str, timestamp: float, response: Dict[str, Any]) -> None:
         try:
-            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.journal_path.open("a", encoding="utf-8") as handle:
-                handle.write(
-                    json.dumps(
-                        {
-                            "requestId": request_id,
-                            "ts": time.time(),
-                            "response": response,
-                        },
-                        ensure_ascii=False,
-                    )
-                    + "\n"
-                )
+            if self._journal_handle is None:
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal_handle = self.journal_path.open("ab")
+            self._journal_handle.write(_journal_line(request_id, timestamp, response).encode("utf-8"))
+            self._unflushed += 1
+            if self._unflushed >= _FLUSH_EVERY:
+                self._journal_handle.flush()
+                self._unflushed = 0
         except OSError:
             # Ignore journaling errors; the in-memory map still guarantees correctness for
             # the current process lifetime.
+            self._close_journal_locked()
+            return
+        self._journal_lines += 1
+        if self._journal_lines > _COMPACT_FACTOR * self.max_entries:
+            self._compact_journal_locked()
+
+    def _close_journal_locked(self) -> None:
+        handle, self._journal_handle = self._journal_handle, None
+        self._unflushed = 0
+        if handle is None:
+            return
+        try:
+            handle.close()
+        except OSError:
             pass
 
+    def close(self) -> None:
+        """Flush and close the journal; a later put reopens it."""
+
+        with self._lock:
+            self._close_journal_locked()
+
+    def _compact_journal_locked(self) -> None:
+        """Rewrite the journal with only the live entries."""
+
+        # The open handle would keep appending to the replaced file.
+        self._close_journal_locked()
+        tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                handle.writelines(
+                    _journal_line(request_id, entry.timestamp, entry.response)
+                    for request_id, entry in self._entries.items()
+                )
+            os.replace(tmp_path, self.journal_path)
+        except OSError:
+            # Keep appending to the old journal; compaction is retried on the next put.
+            return
+        self._journal_lines = len(self._entries)
+
     def get(self, request_id: str) -> Optional[Dict[str, Any]]:
         with self._lock:
-            self._gc_locked()
+            # Misses return after one dict lookup; expiry sweeps only run from put().
             entry = self._entries.get(request_id)
-            if entry:
-                return entry.response
-            return None
+            if not entry:
+                return None
+            # Sweeps are rate limited and put-driven, so an expired entry may still be present.
+            if time.time() - entry.timestamp > self.ttl_sec:
+                return None
+            self._entries.move_to_end(request_id)
+            return entry.response
 
     def put(self, request_id: str, response: Dict[str, Any]) -> None:
         now = time.time()
         with self._lock:
             self._gc_locked(now)
             self._entries[request_id] = _DedupEntry(now, response)
-            if len(self._entries) > self.max_entries:
-                # Remove oldest entries to bound memory usage.
-                sorted_items = sorted(self._entries.items(), key=lambda item: item[1].timestamp)
-                for key, _ in sorted_items[: len(self._entries) - self.max_entries]:
-                    self._entries.pop(key, None)
-            self._append_journal(request_id, response)
+            self._entries.move_to_end(request_id)
+            heapq.heappush(self._expiry_heap, (now, request_id))
+            # Remove least recently used entries to bound memory usage.
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if len(self._expiry_heap) > _HEAP_SLACK_FACTOR * self.max_entries:
+                self._rebuild_expiry_heap_locked()
+            self._append_journal(request_id, now, response)
+
+    def _rebuild_expiry_heap_locked(self) -> None:
+        self._expiry_heap = [(entry.timestamp, key) for key, entry in self._entries.items()]
+        heapq.heapify(self._expiry_heap)
 
     def _gc_locked(self, now: Optional[float] = None) -> None:
+        tick = time.monotonic()
+        if tick - self._last_gc < self.ttl_sec / 16:
+            return
+        self._last_gc = tick
         deadline = (now or time.time()) - self.ttl_sec
-        stale = [key for key, entry in self._entries.items() if entry.timestamp < deadline]
-        for key in stale:
-            self._entries.pop(key, None)
+        heap = self._expiry_heap
+        while heap and heap[0][0] < deadline:
+            timestamp, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # Only drop the entry if it was not replaced by a newer put.
+            if entry is not None and entry.timestamp == timestamp:
+                del self._entries[key]
 
 
 __all__ = ["DedupStore"]
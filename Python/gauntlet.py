@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import mmap
 import os
 import platform
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -28,6 +30,15 @@ GAUNTLET_LOG_PATTERNS = [
 ARTIFACT_PATTERNS = [
     re.compile(r"Artifacts?\s*(?:Dir|Directory|stored at|saved to)[:=]\s*(.+)", re.IGNORECASE),
 ]
+# Finds candidate lines in a single scan over the raw log bytes; the per-line patterns above
+# then run on each candidate so several markers on one line are all picked up.
+GAUNTLET_LINE_RE = re.compile(
+    rb"Results?[^\S\r\n]*-[^\S\r\n]*Total:"
+    rb"|Artifacts?[^\S\r\n]*(?:Dir|Directory|stored at|saved to)[:=]"
+    rb"|Gauntlet[^\S\r\n]*(?:Log|log file)[:=]"
+    rb"|Log file:",
+    re.IGNORECASE,
+)
 
 
 @dataclass
@@ -70,10 +81,12 @@ def _normalize_string_sequence(value: Any, *, default: Optional[Sequence[str]] =
 def _ensure_path(path_str: Any, *, code: str, what: str) -> Path:
     if not path_str:
         raise ToolError(code, f"{what} is required.")
-    candidate = Path(str(path_str)).expanduser().resolve()
-    if not candidate.exists():
-        raise ToolError(code, f"{what} does not exist.", {what: str(candidate)})
-    return candidate
+    candidate = Path(str(path_str)).expanduser()
+    try:
+        # strict resolution fails on a missing path, so no separate exists() stat is needed.
+        return candidate.resolve(strict=True)
+    except (OSError, RuntimeError):
+        raise ToolError(code, f"{what} does not exist.", {what: os.path.abspath(candidate)}) from None
 
 
 def _locate_runuat(engine_root: Path) -> Path:
@@ -92,11 +105,20 @@ def _locate_runuat(engine_root: Path) -> Path:
     return candidate
 
 
+def _decode(value: bytes) -> str:
+    return value.decode("utf-8", errors="replace")
+
+
 def _clean_path(value: str) -> str:
     cleaned = value.strip().strip('"').strip("'")
     return cleaned
 
 
+def _find_or_end(data: Any, needle: bytes, start: int) -> int:
+    index = data.find(needle, start)
+    return len(data) if index < 0 else index
+
+
 def _parse_gauntlet_log(log_path: Path) -> Tuple[Dict[str, Any], bool, Optional[str]]:
     total: Optional[int] = None
     passed: Optional[int] = None
@@ -104,26 +126,40 @@ def _parse_gauntlet_log(log_path: Path) -> Tuple[Dict[str, Any], bool, Optional[
     artifacts_dir: Optional[str] = None
     gauntlet_log: Optional[str] = None
 
-    with open(log_path, "r", encoding="utf-8", errors="replace") as log_file:
-        for line in log_file:
-            if total is None or passed is None or failed is None:
-                match = RESULT_RE.search(line)
-                if match:
-                    total = int(match.group(1))
-                    passed = int(match.group(2))
-                    failed = int(match.group(3))
-            if artifacts_dir is None:
-                for pattern in ARTIFACT_PATTERNS:
-                    match = pattern.search(line)
-                    if match:
-                        artifacts_dir = _clean_path(match.group(1))
-                        break
-            if gauntlet_log is None:
-                for pattern in GAUNTLET_LOG_PATTERNS:
-                    match = pattern.search(line)
-                    if match:
-                        gauntlet_log = _clean_path(match.group(1))
-                        break
+    with open(log_path, "rb") as log_file:
+        size = os.fstat(log_file.fileno()).st_size
+        with (mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) if size else contextlib.nullcontext(b"")) as data:
+            position = 0
+            while True:
+                match = GAUNTLET_LINE_RE.search(data, position)
+                if match is None:
+                    break
+                # A lone CR ends a line too, as it did when the log was read in text mode.
+                line_start = max(data.rfind(b"\n", 0, match.start()), data.rfind(b"\r", 0, match.start())) + 1
+                line_end = min(_find_or_end(data, b"\n", match.end()), _find_or_end(data, b"\r", match.end()))
+                position = line_end + 1
+                line = _decode(data[line_start:line_end])
+
+                if total is None or passed is None or failed is None:
+                    result = RESULT_RE.search(line)
+                    if result:
+                        total = int(result.group(1))
+                        passed = int(result.group(2))
+                        failed = int(result.group(3))
+                if artifacts_dir is None:
+                    for pattern in ARTIFACT_PATTERNS:
+                        result = pattern.search(line)
+                        if result:
+                            artifacts_dir = _clean_path(result.group(1))
+                            break
+                if gauntlet_log is None:
+                    for pattern in GAUNTLET_LOG_PATTERNS:
+                        result = pattern.search(line)
+                        if result:
+                            gauntlet_log = _clean_path(result.group(1))
+                            break
+                if total is not None and artifacts_dir is not None and gauntlet_log is not None:
+                    break
 
     parse_error = total is None or passed is None or failed is None
     results: Dict[str, Any] = {
@@ -210,7 +246,7 @@ def run_gauntlet(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     except ToolError as exc:
         return exc.to_response()
 
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     log_path = make_log_path("gauntlet_uat", root=LOG_ROOT, timestamp=timestamp)
 
     command = _build_command(config)
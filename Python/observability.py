@@ -1,18 +1,31 @@
 """Lightweight structured logging helpers for the MCP server."""
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
 import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 _MAX_FILE_BYTES = 20 * 1024 * 1024
 _MAX_GENERATIONS = 3
+_BATCH_SIZE = 512
+_FLUSH_TIMEOUT_SECONDS = 5.0
 _LOCK = threading.RLock()
 _EVENTS_PATH: Optional[Path] = None
 _METRICS_PATH: Optional[Path] = None
 
+# Lines are encoded by the caller and written by a single background thread;
+# flush() enqueues an Event that is set once everything before it is written.
+_QUEUE: "queue.SimpleQueue[Union[Tuple[Path, bytes], threading.Event]]" = queue.SimpleQueue()
+_WRITER: Optional[threading.Thread] = None
+# Bytes written to each log so far; stat() only runs the first time a path is seen.
+_SIZES: Dict[Path, int] = {}
+# Append handles kept open by the writer thread; closed before rotation and on exit.
+_HANDLES: Dict[Path, BinaryIO] = {}
+
 
 def init(directory: Path | str, enable: bool = True) -> None:
     """Initialise the structured log writers."""
@@ -25,16 +38,50 @@ def init(directory: Path | str, enable: bool = True) -> None:
 
     base = Path(directory)
     base.mkdir(parents=True, exist_ok=True)
+    flush()
+    _close_handles()
     _EVENTS_PATH = base / "events.jsonl"
     _METRICS_PATH = base / "metrics.jsonl"
+    _start_writer()
 
 
-def _rotate(path: Path) -> None:
-    if not path.exists():
-        return
-    if path.stat().st_size < _MAX_FILE_BYTES:
+def flush(timeout: Optional[float] = _FLUSH_TIMEOUT_SECONDS) -> None:
+    """Block until every entry logged so far has been written."""
+    if _WRITER is None or not _WRITER.is_alive():
         return
+    done = threading.Event()
+    _QUEUE.put(done)
+    done.wait(timeout)
+
+
+def _shutdown() -> None:
+    flush()
+    _close_handles()
+
+
+def _close_handles() -> None:
+    with _LOCK:
+        while _HANDLES:
+            _, handle = _HANDLES.popitem()
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+
+def _start_writer() -> None:
+    global _WRITER
 
+    with _LOCK:
+        if _WRITER is not None and _WRITER.is_alive():
+            return
+        if _WRITER is None:
+            atexit.register(_shutdown)
+        _WRITER = threading.Thread(target=_drain, name="observability-writer", daemon=True)
+        _WRITER.start()
+
+
+def _rotate(path: Path) -> None:
     for index in range(_MAX_GENERATIONS - 1, -1, -1):
         source = path if index == 0 else path.with_suffix(path.suffix + f".{index}")
         if not source.exists():
@@ -46,14 +93,68 @@ def _rotate(path: Path) -> None:
         source.rename(dest)
 
 
+def _drain() -> None:
+    while True:
+        batch = [_QUEUE.get()]
+        while len(batch) < _BATCH_SIZE:
+            try:
+                batch.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        _write_batch(batch)
+
+
+def _write_batch(batch: List[Union[Tuple[Path, bytes], threading.Event]]) -> None:
+    pending: Dict[Path, List[bytes]] = {}
+    for item in batch:
+        if isinstance(item, threading.Event):
+            _write_pending(pending)
+            pending = {}
+            item.set()
+            continue
+        path, line = item
+        pending.setdefault(path, []).append(line)
+    _write_pending(pending)
+
+
+def _write_pending(pending: Dict[Path, List[bytes]]) -> None:
+    for path, lines in pending.items():
+        data = b"".join(lines)
+        try:
+            with _LOCK:
+                size = _SIZES.get(path)
+                if size is None:
+                    size = path.stat().st_size if path.exists() else 0
+                handle = _HANDLES.get(path)
+                if size >= _MAX_FILE_BYTES:
+                    if handle is not None:
+                        del _HANDLES[path]
+                        handle.close()
+                        handle = None
+                    _rotate(path)
+                    size = 0
+                if handle is None:
+                    handle = _HANDLES[path] = path.open("ab")
+                handle.write(data)
+                handle.flush()
+                _SIZES[path] = size + len(data)
+        except OSError:
+            # Structured logs are best effort; never take the writer thread down.
+            # Drop the handle and cached size so the next batch starts from disk again.
+            _SIZES.pop(path, None)
+            handle = _HANDLES.pop(path, None)
+            if handle is not None:
+                try:
+                    handle.close()
+                except OSError:
+                    pass
+            continue
+
+
 def _write_line(path: Optional[Path], payload: Dict[str, Any]) -> None:
     if path is None:
         return
-    with _LOCK:
-        _rotate(path)
-        with path.open("a", encoding="utf-8") as handle:
-            json.dump(payload, handle, separators=(",", ":"))
-            handle.write("\n")
+    _QUEUE.put((path, (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")))
 
 
 def log_event(
@@ -63,7 +164,7 @@ def log_event(
     request_id: Optional[str] = None,
     session_id: Optional[str] = None,
     fields: Optional[Dict[str, Any]] = None,
-    ts_ms: Optional[float] = None,
+    ts_ms: Optional[int] = None,
 ) -> None:
     """Append an event entry to the structured log."""
     payload: Dict[str, Any] = {
@@ -94,8 +195,8 @@ def log_metric(name: str, fields: Optional[Dict[str, Any]] = None) -> None:
     _write_line(_METRICS_PATH, payload)
 
 
-def _now_ms() -> float:
-    return time.time() * 1000.0
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
 
 
 import time  # placed at end to avoid circular import during module load
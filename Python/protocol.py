@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import json
 import socket
-import struct
 import time
 from typing import Any, Dict, Optional
 
 HEADER_SIZE = 4
 MAX_FRAME_SIZE = 4 * 1024 * 1024  # 4 MiB safety limit
 
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
 
 class ProtocolError(Exception):
     """Raised when a protocol level error occurs."""
@@ -56,26 +57,26 @@ def read_exact(sock: socket.socket, size: int, timeout: Optional[float] = None)
         return b""
 
     deadline = _monotonic_deadline(timeout)
-    chunks: list[bytes] = []
-    remaining = size
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
 
-    while remaining > 0:
+    while received < size:
         chunk_timeout = _remaining_time(deadline)
         try:
             _wait_for_socket(sock, chunk_timeout)
-            chunk = sock.recv(remaining)
+            count = sock.recv_into(view[received:])
         except socket.timeout as exc:  # pragma: no cover - depends on OS timing
             raise ProtocolError("READ_TIMEOUT", "Timed out while reading from socket.") from exc
         except OSError as exc:  # pragma: no cover - rare transport errors
             raise ProtocolError("MALFORMED_FRAME", f"Socket read failed: {exc}") from exc
 
-        if not chunk:
+        if not count:
             raise ProtocolError("MALFORMED_FRAME", "Socket closed while reading data.")
 
-        chunks.append(chunk)
-        remaining -= len(chunk)
+        received += count
 
-    return b"".join(chunks)
+    return bytes(buffer)
 
 
 def write_all(sock: socket.socket, data: bytes, timeout: Optional[float] = None) -> None:
@@ -107,20 +108,24 @@ def write_all(sock: socket.socket, data: bytes, timeout: Optional[float] = None)
 def write_frame(sock: socket.socket, payload: Dict[str, Any], timeout: Optional[float] = None) -> None:
     """Encode ``payload`` as JSON and send it as a framed message."""
 
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    # A closed socket reports fileno() == -1; fail before paying for the encode.
+    fileno = getattr(sock, "fileno", None)
+    if fileno is not None and fileno() < 0:
+        raise ProtocolError("WRITE_ERROR", "Socket closed while writing data.")
+
+    body = _encode_json(payload).encode("utf-8")
     if len(body) > MAX_FRAME_SIZE:
         raise ProtocolError("MALFORMED_FRAME", "Payload exceeds maximum frame size.", {"length": len(body)})
 
-    header = struct.pack("<I", len(body))
-    write_all(sock, header, timeout)
-    write_all(sock, body, timeout)
+    # One buffer so the header never goes out as its own segment.
+    write_all(sock, len(body).to_bytes(HEADER_SIZE, "little") + body, timeout)
 
 
 def read_frame(sock: socket.socket, timeout: Optional[float] = None) -> Dict[str, Any]:
     """Read a single framed JSON message from ``sock``."""
 
     header = read_exact(sock, HEADER_SIZE, timeout)
-    (length,) = struct.unpack("<I", header)
+    length = int.from_bytes(header, "little")
     if length == 0 or length > MAX_FRAME_SIZE:
         raise ProtocolError("MALFORMED_FRAME", "Invalid frame length.", {"length": length})
 
@@ -147,4 +152,4 @@ def make_error(code: str, message: str, details: Optional[Dict[str, Any]] = None
 def current_timestamp_ms() -> int:
     """Return the current Unix timestamp in milliseconds."""
 
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
@@ -11,13 +11,21 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
 from threading import RLock
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 
-def _canonicalize_payload(payload: Dict[str, object]) -> bytes:
+def _canonical_chunks(payload: Dict[str, object]) -> Iterator[bytes]:
+    """Yield the sorted, compact JSON encoding of ``payload`` one member at a time."""
     import json
 
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    def encode(value: object) -> str:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    separator = "{"
+    for key in sorted(payload):
+        yield f"{separator}{encode(key)}:{encode(payload[key])}".encode("utf-8")
+        separator = ","
+    yield b"}" if separator == "," else b"{}"
 
 
 @dataclass
@@ -30,6 +38,8 @@ class AuditRecord:
 class AuditSigner:
     def __init__(self, secret: Optional[str]) -> None:
         self.secret = secret.encode("utf-8") if secret else None
+        # The keyed inner/outer state is derived once; sign() copies it.
+        self._hmac_template = hmac.new(self.secret, b"", sha256) if self.secret else None
         self._lock = RLock()
         self._recent: Dict[str, float] = {}
         self.ttl = 3600.0
@@ -38,13 +48,14 @@ class AuditSigner:
         return self.secret is not None
 
     def sign(self, record: AuditRecord) -> Optional[Dict[str, str]]:
-        if not self.secret:
+        if self._hmac_template is None:
             return None
-        payload = {"requestId": record.request_id, "tool": record.tool, **record.payload}
         server_ts = datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
-        payload_with_ts = {**payload, "serverTs": server_ts}
-        canonical = _canonicalize_payload(payload_with_ts)
-        signature = base64.b64encode(hmac.new(self.secret, canonical, sha256).digest()).decode("ascii")
+        payload = {"requestId": record.request_id, "tool": record.tool, **record.payload, "serverTs": server_ts}
+        digest = self._hmac_template.copy()
+        for chunk in _canonical_chunks(payload):
+            digest.update(chunk)
+        signature = base64.b64encode(digest.digest()).decode("ascii")
         nonce = str(uuid.uuid4())
         timestamp = time.time()
         with self._lock:
@@ -4,13 +4,46 @@ from __future__ import annotations
 
 import fnmatch
 import os
+import re
+import sys
+import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from threading import RLock
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
+from .sandbox import is_path_allowed_normalized, normalize_roots
+
+_MAX_CACHED_DECISIONS = 4096
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Optional["re.Pattern[str]"]:
+    """Combine glob ``patterns`` into one regex, or ``None`` when there are none."""
+
+    translated = [fnmatch.translate(pattern) for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+@lru_cache(maxsize=256)
+def _compile_rule_set(patterns: Tuple[str, ...]) -> Tuple[Optional["re.Pattern[str]"], Optional["re.Pattern[str]"]]:
+    """Split ``!``-prefixed denies from allows and compile each side once."""
+
+    allow: List[str] = []
+    deny: List[str] = []
+    for pattern in normalize_patterns(patterns):
+        if pattern.startswith("!"):
+            candidate = pattern[1:].strip()
+            if candidate:
+                deny.append(candidate)
+        else:
+            allow.append(pattern)
+    return _compile_patterns(allow), _compile_patterns(deny)
+
 
 @dataclass
 class RoleRules:
@@ -18,31 +51,20 @@ class RoleRules:
 
     allow: List[str] = field(default_factory=list)
     deny: List[str] = field(default_factory=list)
+    _allow_re: Optional["re.Pattern[str]"] = field(default=None, init=False, repr=False, compare=False)
+    _deny_re: Optional["re.Pattern[str]"] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        patterns = tuple(self.allow) + tuple(f"!{pattern}" for pattern in self.deny)
+        self._allow_re, self._deny_re = _compile_rule_set(patterns)
 
     def evaluate(self, tool: str) -> bool:
         """Return ``True`` when ``tool`` is permitted for the role."""
 
         normalized_tool = tool or ""
-        explicit_allow = False
-
-        patterns = self.allow + [f"!{pattern}" for pattern in self.deny]
-        if not patterns:
+        if self._deny_re is not None and self._deny_re.match(normalized_tool):
             return False
-
-        for pattern in patterns:
-            pattern = pattern.strip()
-            if not pattern:
-                continue
-            is_deny = pattern.startswith("!")
-            if is_deny:
-                pattern = pattern[1:].strip()
-            if not pattern:
-                continue
-            if fnmatch.fnmatchcase(normalized_tool, pattern):
-                if is_deny:
-                    return False
-                explicit_allow = True
-        return explicit_allow
+        return self._allow_re is not None and self._allow_re.match(normalized_tool) is not None
 
 
 @dataclass
@@ -57,6 +79,16 @@ class PolicyLimits:
 class PathRules:
     allowed: List[str] = field(default_factory=list)
     forbidden: List[str] = field(default_factory=list)
+    # Roots normalized once when the policy is built, for is_path_allowed_normalized.
+    allowed_norm: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    forbidden_norm: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.allowed_norm = normalize_roots(self.allowed)
+        self.forbidden_norm = normalize_roots(self.forbidden)
+
+    def is_path_allowed(self, path: str) -> bool:
+        return is_path_allowed_normalized(path, self.allowed_norm, self.forbidden_norm)
 
 
 @dataclass
@@ -71,21 +103,34 @@ class Policy:
     limits: PolicyLimits = field(default_factory=PolicyLimits)
     paths: PathRules = field(default_factory=PathRules)
     audit: AuditRules = field(default_factory=AuditRules)
+    # (role, tool) -> decision; a reload builds a new Policy, so entries never go stale.
+    _decisions: Dict[Tuple[str, str], bool] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def role_rules(self, role: str) -> RoleRules:
         return self.roles.get(role, RoleRules())
 
     def is_tool_allowed(self, role: str, tool: str) -> bool:
-        rules = self.role_rules(role)
-        return rules.evaluate(tool)
+        key = (role, tool)
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = self.role_rules(role).evaluate(tool)
+            if len(self._decisions) >= _MAX_CACHED_DECISIONS:
+                self._decisions.clear()
+            self._decisions[key] = decision
+        return decision
 
 
 class PolicyLoader:
     """Load and cache policy documents from disk."""
 
-    def __init__(self, policy_path: Optional[Path] = None) -> None:
+    def __init__(self, policy_path: Optional[Path] = None, refresh_interval: float = 2.0) -> None:
         self.policy_path = policy_path or self._resolve_from_env()
+        self.refresh_interval = refresh_interval
         self._policy: Optional[Policy] = None
+        # st_mtime_ns of the file behind ``_policy``; None when there was no file.
+        self._mtime_ns: Optional[int] = None
+        # time.monotonic() of the last mtime check; load() skips the lock and stat within the interval.
+        self._checked_at = float("-inf")
         self._lock = RLock()
 
     def _resolve_from_env(self) -> Optional[Path]:
@@ -95,17 +140,34 @@ class PolicyLoader:
         return None
 
     def load(self, force: bool = False) -> Policy:
+        """Return the policy, re-parsing only when forced or the file changed on disk."""
+
+        policy = self._policy
+        if policy is not None and not force and time.monotonic() - self._checked_at < self.refresh_interval:
+            return policy
+
         with self._lock:
-            if self._policy is not None and not force:
+            self._checked_at = time.monotonic()
+            mtime_ns = self._policy_mtime_ns()
+            if self._policy is not None and not force and mtime_ns == self._mtime_ns:
                 return self._policy
             data = self._read_policy()
             self._policy = self._parse_policy(data)
+            self._mtime_ns = mtime_ns
             return self._policy
 
+    def _policy_mtime_ns(self) -> Optional[int]:
+        if not self.policy_path:
+            return None
+        try:
+            return self.policy_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _read_policy(self) -> Dict[str, object]:
         if self.policy_path and self.policy_path.exists():
             with self.policy_path.open("r", encoding="utf-8") as handle:
-                return yaml.safe_load(handle) or {}
+                return yaml.load(handle, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
         return {}
 
     def _parse_policy(self, data: Dict[str, object]) -> Policy:
@@ -115,7 +177,8 @@ class PolicyLoader:
             if isinstance(payload, dict):
                 allow = [str(p) for p in payload.get("allow", []) if isinstance(p, str)]
                 deny = [str(p) for p in payload.get("deny", []) if isinstance(p, str)]
-                roles[name] = RoleRules(allow=allow, deny=deny)
+                # Interned so role lookups against caller-supplied names can short-circuit on identity.
+                roles[sys.intern(name) if isinstance(name, str) else name] = RoleRules(allow=allow, deny=deny)
 
         limits_data = data.get("limits", {}) if isinstance(data, dict) else {}
         limits = PolicyLimits(
@@ -157,18 +220,10 @@ def evaluate_patterns(patterns: Iterable[str], target: str) -> bool:
     and no matching deny.
     """
 
-    normalized_patterns = normalize_patterns(patterns)
-    allowed = False
-    for pattern in normalized_patterns:
-        negate = pattern.startswith("!")
-        candidate = pattern[1:].strip() if negate else pattern
-        if not candidate:
-            continue
-        if fnmatch.fnmatchcase(target, candidate):
-            if negate:
-                return False
-            allowed = True
-    return allowed
+    allow_re, deny_re = _compile_rule_set(tuple(patterns))
+    if deny_re is not None and deny_re.match(target):
+        return False
+    return allow_re is not None and allow_re.match(target) is not None
 
 
 __all__ = [
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 import time
-from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Deque, Dict, Tuple
+from typing import Dict, List, Tuple
+
+_LOCK_STRIPES = 16
 
 
 @dataclass
@@ -18,29 +20,52 @@ class RateLimiter:
     def __init__(self, config: RateLimitConfig) -> None:
         self.config = config
         self.window = 60.0
-        self.global_hits: Deque[float] = deque()
-        self.tool_hits: Dict[str, Deque[float]] = defaultdict(deque)
+        # Buckets are [tokens, last_refill] pairs on the monotonic clock; each holds up to
+        # one window's quota and refills continuously at quota / window tokens per second.
+        now = time.monotonic()
+        self._global: List[float] = [float(config.per_minute_global), now]
+        self._tools: Dict[str, List[float]] = {}
+        # Tool buckets are guarded by one of several striped locks so unrelated tools do not
+        # contend; only the global bucket update is serialized.
+        self._global_lock = threading.Lock()
+        self._tool_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+    def _refill(self, bucket: List[float], capacity: int, now: float) -> float:
+        tokens = min(float(capacity), bucket[0] + (now - bucket[1]) * capacity / self.window)
+        bucket[0] = tokens
+        bucket[1] = now
+        return tokens
 
-    def _prune(self, hits: Deque[float], now: float) -> None:
-        while hits and now - hits[0] > self.window:
-            hits.popleft()
+    def _retry_after(self, tokens: float, capacity: int) -> float:
+        if capacity <= 0:
+            return self.window
+        return (1.0 - tokens) * self.window / capacity
 
     def check(self, tool: str) -> Tuple[bool, float]:
-        now = time.time()
-        self._prune(self.global_hits, now)
-        self._prune(self.tool_hits[tool], now)
+        now = time.monotonic()
+        global_capacity = self.config.per_minute_global
+        tool_capacity = self.config.per_minute_tool
+        tool_lock = self._tool_locks[hash(tool) % _LOCK_STRIPES]
 
-        if len(self.global_hits) >= self.config.per_minute_global:
-            retry = max(0.0, self.window - (now - self.global_hits[0]))
-            return False, retry
+        with tool_lock:
+            bucket = self._tools.get(tool)
+            if bucket is None:
+                bucket = self._tools[tool] = [float(tool_capacity), now]
+            tool_tokens = self._refill(bucket, tool_capacity, now)
+            if tool_tokens < 1.0:
+                return False, self._retry_after(tool_tokens, tool_capacity)
+            bucket[0] = tool_tokens - 1.0
 
-        if len(self.tool_hits[tool]) >= self.config.per_minute_tool:
-            retry = max(0.0, self.window - (now - self.tool_hits[tool][0]))
-            return False, retry
+        with self._global_lock:
+            global_tokens = self._refill(self._global, global_capacity, now)
+            if global_tokens >= 1.0:
+                self._global[0] = global_tokens - 1.0
+                return True, 0.0
 
-        self.global_hits.append(now)
-        self.tool_hits[tool].append(now)
-        return True, 0.0
+        # The global quota is exhausted: hand back the tool token taken above.
+        with tool_lock:
+            bucket[0] = min(float(tool_capacity), bucket[0] + 1.0)
+        return False, self._retry_after(global_tokens, global_capacity)
 
 
 __all__ = ["RateLimitConfig", "RateLimiter"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Tuple
 
 
 def _normalize(path: Path) -> Path:
@@ -22,29 +22,44 @@ def normalize_path(path: str) -> Path:
 
     candidate = Path(path)
     if not candidate.is_absolute():
-        candidate = (Path.cwd() / candidate).resolve()
+        candidate = Path.cwd() / candidate
     return _normalize(candidate)
 
 
+def _under(candidate: str, root: str) -> bool:
+    # Compare POSIX-style strings; ``root + "/"`` keeps "/a/bc" from matching root "/a/b".
+    if candidate == root:
+        return True
+    return candidate.startswith(root if root.endswith("/") else root + "/")
+
+
+def normalize_roots(roots: Iterable[str]) -> Tuple[str, ...]:
+    """Normalize policy roots once into the strings ``is_path_allowed_normalized`` expects."""
+
+    return tuple(normalize_path(root).as_posix() for root in roots)
+
+
 def is_within(path: Path, roots: Iterable[str]) -> bool:
-    normalized_path = normalize_path(str(path))
-    for root in roots:
-        root_path = normalize_path(root)
-        try:
-            normalized_path.relative_to(root_path)
-            return True
-        except ValueError:
-            continue
-    return False
+    return _within_normalized(normalize_path(str(path)).as_posix(), normalize_roots(roots))
 
 
-def is_path_allowed(path: str, allowed_roots: Iterable[str], forbidden_roots: Iterable[str]) -> bool:
-    normalized = normalize_path(path)
-    if forbidden_roots and is_within(normalized, forbidden_roots):
+def _within_normalized(candidate: str, roots: Tuple[str, ...]) -> bool:
+    return any(_under(candidate, root) for root in roots)
+
+
+def is_path_allowed_normalized(path: str, allowed_norm: Tuple[str, ...], forbidden_norm: Tuple[str, ...]) -> bool:
+    """Like ``is_path_allowed`` but with roots already passed through ``normalize_roots``."""
+
+    candidate = normalize_path(path).as_posix()
+    if forbidden_norm and _within_normalized(candidate, forbidden_norm):
         return False
-    if not allowed_roots:
+    if not allowed_norm:
         return True
-    return is_within(normalized, allowed_roots)
+    return _within_normalized(candidate, allowed_norm)
+
+
+def is_path_allowed(path: str, allowed_roots: Iterable[str], forbidden_roots: Iterable[str]) -> bool:
+    return is_path_allowed_normalized(path, normalize_roots(allowed_roots), normalize_roots(forbidden_roots))
 
 
-__all__ = ["is_path_allowed", "normalize_path"]
+__all__ = ["is_path_allowed", "is_path_allowed_normalized", "normalize_path", "normalize_roots"]
@@ -36,19 +36,30 @@ SCHEMAS: Dict[str, Dict[str, Any]] = {
 }
 
 
+def _build_validator(schema: Dict[str, Any]) -> Any:
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+# Compiled once at import; jsonschema.validate() would rebuild the validator on every call.
+_VALIDATORS: Dict[str, Any] = (
+    {tool: _build_validator(schema) for tool, schema in SCHEMAS.items()} if jsonschema else {}
+)
+
+
 def get_schema(tool: str) -> Optional[Dict[str, Any]]:
     return SCHEMAS.get(tool)
 
 
 def validate(tool: str, params: Dict[str, Any]) -> Optional[str]:
-    schema = get_schema(tool)
-    if not schema or not jsonschema:
+    validator = _VALIDATORS.get(tool)
+    if validator is None:
+        return None
+    error = jsonschema.exceptions.best_match(validator.iter_errors(params))
+    if error is None:
         return None
-    try:
-        jsonschema.validate(instance=params, schema=schema)  # type: ignore[arg-type]
-    except Exception as exc:  # pragma: no cover - error path
-        return str(exc)
-    return None
+    return str(error)
 
 
 __all__ = ["get_schema", "validate"]
@@ -4,6 +4,10 @@ import platform, time, os
 
 mcp = FastMCP("unreal-mcp-fork")
 
+# Invariants du process, calculés une seule fois (platform.platform() est lent)
+_PY_VERSION = platform.python_version()
+_PLATFORM_STR = platform.platform()
+
 @mcp.tool()
 def mcp_health(ctx: Context) -> dict:
     """Health check simple (read-only)."""
@@ -11,8 +15,8 @@ def mcp_health(ctx: Context) -> dict:
         "ok": True,
         "server": {
             "name": "unreal-mcp-fork",
-            "python": platform.python_version(),
-            "platform": platform.platform(),
+            "python": _PY_VERSION,
+            "platform": _PLATFORM_STR,
             "cwd": os.getcwd(),
         },
         "time": time.time(),
@@ -0,0 +1,76 @@
+import errno
+import sys
+
+import pytest
+
+import automation
+from automation import spawn_process
+
+# Enough output to fill the pipe several times over, so a reader that stops
+# draining leaves the child blocked until the timeout.
+LINE_COUNT = 50_000
+CHATTY_CHILD = [
+    sys.executable,
+    "-c",
+    f"import sys\nfor i in range({LINE_COUNT}): sys.stdout.write('line %d\\n' % i)",
+]
+
+
+def expected_log() -> bytes:
+    return b"".join(b"line %d\n" % i for i in range(LINE_COUNT))
+
+
+@pytest.mark.skipif(not automation._HAS_SPLICE, reason="os.splice unavailable")
+def test_splice_failure_falls_back_to_copying(tmp_path, monkeypatch):
+    def failing_splice(*args, **kwargs):
+        raise OSError(errno.EINVAL, "Invalid argument")
+
+    monkeypatch.setattr(automation.os, "splice", failing_splice)
+    result = spawn_process(CHATTY_CHILD, log_path=tmp_path / "out.log", timeout_seconds=30)
+
+    assert not result.timed_out
+    assert result.exit_code == 0
+    assert result.log_path.read_bytes() == expected_log()
+    assert result.last_lines[-1] == f"line {LINE_COUNT - 1}"
+
+
+def test_output_is_logged_in_full(tmp_path):
+    result = spawn_process(CHATTY_CHILD, log_path=tmp_path / "out.log", timeout_seconds=30)
+
+    assert result.exit_code == 0
+    assert result.log_path.read_bytes() == expected_log()
+
+
+def test_failing_scanner_does_not_stop_the_log(tmp_path):
+    calls = []
+
+    def scanner(block: bytes) -> None:
+        calls.append(len(block))
+        raise RuntimeError("boom")
+
+    result = spawn_process(CHATTY_CHILD, log_path=tmp_path / "out.log", timeout_seconds=30, output_scanner=scanner)
+
+    assert not result.timed_out
+    assert result.exit_code == 0
+    assert len(calls) == 1
+    assert result.log_path.read_bytes() == expected_log()
+
+
+def test_scanner_sees_every_line_once(tmp_path):
+    blocks = []
+    result = spawn_process(CHATTY_CHILD, log_path=tmp_path / "out.log", timeout_seconds=30, output_scanner=blocks.append)
+
+    assert result.exit_code == 0
+    assert all(block.endswith(b"\n") for block in blocks)
+    assert b"".join(blocks) == expected_log()
+
+
+def test_unterminated_output_is_scanned_in_bounded_pieces(tmp_path):
+    size = 3 * automation._MAX_PENDING_BYTES + 123
+    child = [sys.executable, "-c", f"import sys; sys.stdout.write('x' * {size})"]
+    blocks = []
+    result = spawn_process(child, log_path=tmp_path / "out.log", timeout_seconds=30, output_scanner=blocks.append)
+
+    assert result.exit_code == 0
+    assert b"".join(blocks) == b"x" * size
+    assert max(map(len, blocks)) < automation._MAX_PENDING_BYTES + automation._READ_CHUNK_SIZE
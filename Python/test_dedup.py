@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+import dedup
+from dedup import DedupStore
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    monkeypatch.setattr(dedup, "time", fake_clock)
+    return fake_clock
+
+
+def make_store(tmp_path, **kwargs) -> DedupStore:
+    return DedupStore(journal_path=tmp_path / "dedup.jsonl", **kwargs)
+
+
+def journal_lines(store: DedupStore):
+    return [json.loads(line) for line in store.journal_path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def test_put_and_get_roundtrip(tmp_path, clock):
+    store = make_store(tmp_path)
+    store.put("a", {"ok": True})
+    assert store.get("a") == {"ok": True}
+    assert store.get("missing") is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    store = make_store(tmp_path, max_entries=2)
+    store.put("a", {"v": 1})
+    store.put("b", {"v": 2})
+    assert store.get("a") == {"v": 1}
+    store.put("c", {"v": 3})
+
+    assert store.get("b") is None
+    assert store.get("a") == {"v": 1}
+    assert store.get("c") == {"v": 3}
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    store = make_store(tmp_path, ttl_sec=60)
+    store.put("a", {"v": 1})
+    clock.advance(59)
+    assert store.get("a") == {"v": 1}
+    clock.advance(2)
+    assert store.get("a") is None
+
+    # The next put sweeps the expired entry out of memory.
+    store.put("b", {"v": 2})
+    assert "a" not in store._entries
+    assert store.get("b") == {"v": 2}
+
+
+def test_reput_refreshes_expiry(tmp_path, clock):
+    store = make_store(tmp_path, ttl_sec=60)
+    store.put("a", {"v": 1})
+    clock.advance(50)
+    store.put("a", {"v": 2})
+    clock.advance(50)
+    store.put("b", {"v": 3})
+    assert store.get("a") == {"v": 2}
+
+
+def test_expiry_heap_stays_bounded_by_max_entries(tmp_path, clock):
+    store = make_store(tmp_path, max_entries=4, ttl_sec=3600)
+    for index in range(200):
+        store.put(f"k{index}", {"v": index})
+        clock.advance(0.001)
+    for _ in range(200):
+        store.put("k199", {"v": "again"})
+    assert len(store._entries) == 4
+    assert len(store._expiry_heap) <= dedup._HEAP_SLACK_FACTOR * store.max_entries + 1
+
+
+def test_journal_is_compacted_to_live_entries(tmp_path, clock):
+    store = make_store(tmp_path, max_entries=2)
+    for index in range(dedup._COMPACT_FACTOR * 2 + 1):
+        store.put(f"k{index}", {"v": index})
+    store.close()
+
+    lines = journal_lines(store)
+    assert len(lines) <= dedup._COMPACT_FACTOR * store.max_entries
+    assert [line["requestId"] for line in lines][-2:] == list(store._entries)
+
+    reloaded = make_store(tmp_path, max_entries=2)
+    assert list(reloaded._entries) == list(store._entries)
+
+
+def test_journal_survives_restart(tmp_path, clock):
+    store = make_store(tmp_path)
+    store.put("a", {"text": "héllo"})
+    store.close()
+
+    reloaded = make_store(tmp_path)
+    assert reloaded.get("a") == {"text": "héllo"}
+
+
+def test_replays_journal_written_by_previous_format(tmp_path, clock):
+    now = clock.now
+    # Lines as the earlier json.dumps(..., ensure_ascii=False) writer produced them.
+    legacy = [
+        {"requestId": "live", "ts": now - 10, "response": {"ok": True, "ts": 1}},
+        {"requestId": "expired", "ts": now - 10_000, "response": {"ok": True}},
+        {"requestId": "no-response", "ts": now},
+        {"requestId": "unicode", "ts": now - 1, "response": {"msg": "déjà"}},
+    ]
+    text = "\n".join(json.dumps(entry, ensure_ascii=False) for entry in legacy)
+    text += "\n\nnot json\n[1, 2]\n"
+    (tmp_path / "dedup.jsonl").write_text(text, encoding="utf-8")
+
+    store = make_store(tmp_path, ttl_sec=600)
+    assert store.get("live") == {"ok": True, "ts": 1}
+    assert store.get("unicode") == {"msg": "déjà"}
+    assert store.get("expired") is None
+    assert store.get("no-response") is None
+
+    # New appends go after the legacy lines and replay together with them.
+    store.put("new", {"ok": False})
+    store.close()
+    reloaded = make_store(tmp_path, ttl_sec=600)
+    assert set(reloaded._entries) == {"live", "unicode", "new"}
@@ -0,0 +1,91 @@
+"""The single-scan Gauntlet log parser must agree with the earlier per-line parser."""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
+
+from gauntlet import _parse_gauntlet_log
+
+# --- Reference parser, as it read the log line by line in text mode.
+
+RESULT_RE = re.compile(r"Results?\s*-\s*Total:\s*(\d+),\s*Passed:\s*(\d+),\s*Failed:\s*(\d+)", re.IGNORECASE)
+GAUNTLET_LOG_PATTERNS = [
+    re.compile(r"Gauntlet\s*(?:Log|log file)[:=]\s*(.+)", re.IGNORECASE),
+    re.compile(r"Log file:\s*(.+Gauntlet.+\.log)", re.IGNORECASE),
+]
+ARTIFACT_PATTERNS = [
+    re.compile(r"Artifacts?\s*(?:Dir|Directory|stored at|saved to)[:=]\s*(.+)", re.IGNORECASE),
+]
+
+
+def _clean_path(value: str) -> str:
+    return value.strip().strip('"').strip("'")
+
+
+def reference_gauntlet_log(log_path: Path) -> Tuple[Dict[str, Any], bool, Optional[str]]:
+    total = passed = failed = None
+    artifacts_dir: Optional[str] = None
+    gauntlet_log: Optional[str] = None
+    with open(log_path, "r", encoding="utf-8", errors="replace") as log_file:
+        for line in log_file:
+            if total is None or passed is None or failed is None:
+                match = RESULT_RE.search(line)
+                if match:
+                    total, passed, failed = (int(value) for value in match.groups())
+            if artifacts_dir is None:
+                for pattern in ARTIFACT_PATTERNS:
+                    match = pattern.search(line)
+                    if match:
+                        artifacts_dir = _clean_path(match.group(1))
+                        break
+            if gauntlet_log is None:
+                for pattern in GAUNTLET_LOG_PATTERNS:
+                    match = pattern.search(line)
+                    if match:
+                        gauntlet_log = _clean_path(match.group(1))
+                        break
+    parse_error = total is None or passed is None or failed is None
+    results: Dict[str, Any] = {"total": total or 0, "passed": passed or 0, "failed": failed or 0}
+    if artifacts_dir:
+        results["artifactsDir"] = artifacts_dir
+    return results, parse_error, gauntlet_log
+
+
+SAMPLES = {
+    "separate-lines": (
+        b"Gauntlet: starting\n"
+        b"Artifacts Dir: \"C:/Build/Artifacts\"\r\n"
+        b"Gauntlet Log: C:/Logs/Gauntlet.log\n"
+        b"Results - Total: 5, Passed: 4, Failed: 1\n"
+        b"Result - Total: 9, Passed: 9, Failed: 0\n"
+    ),
+    "summary-after-artifacts": b"Artifacts Dir: x  Results - Total: 3, Passed: 3, Failed: 0\n",
+    "artifacts-after-log": b"Gauntlet Log: a.log Artifacts Dir: b\n",
+    "all-on-one-line": b"Log file: /tmp/Gauntlet_run.log Artifact saved to: out Results - Total: 2, Passed: 1, Failed: 1",
+    "lone-cr": b"progress\rArtifacts Dir: x\rResults - Total: 1, Passed: 1, Failed: 0\rGauntlet log file= g.log\r",
+    "split-marker": b"Results -\nTotal: 1, Passed: 1, Failed: 0\nArtifacts Dir:\xff weird\n",
+    "no-summary": b"Artifacts Dir: only\n",
+    "empty": b"",
+}
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_matches_per_line_parser(tmp_path, name):
+    log_path = tmp_path / "gauntlet.log"
+    log_path.write_bytes(SAMPLES[name])
+    assert _parse_gauntlet_log(log_path) == reference_gauntlet_log(log_path)
+
+
+def test_same_line_markers_are_all_found(tmp_path):
+    log_path = tmp_path / "gauntlet.log"
+    log_path.write_bytes(SAMPLES["summary-after-artifacts"])
+    results, parse_error, _ = _parse_gauntlet_log(log_path)
+    assert not parse_error
+    assert results["total"] == 3
+
+    log_path.write_bytes(SAMPLES["artifacts-after-log"])
+    results, _, gauntlet_log = _parse_gauntlet_log(log_path)
+    assert results["artifactsDir"] == "b"
+    assert gauntlet_log == "a.log Artifacts Dir: b"
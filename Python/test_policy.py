@@ -0,0 +1,127 @@
+import os
+
+import pytest
+
+from security import policy as policy_module
+from security.policy import Policy, PolicyLoader, RoleRules, evaluate_patterns
+
+POLICY_YAML = """
+roles:
+  viewer:
+    allow: ["editor.get_*", "mcp.health"]
+  builder:
+    allow: ["*"]
+    deny: ["editor.delete_*"]
+limits:
+  rate_per_minute_global: 60
+  rate_per_minute_per_tool: 10
+paths:
+  allowed: ["{allowed}"]
+  forbidden: ["{forbidden}"]
+"""
+
+
+@pytest.fixture
+def policy_file(tmp_path):
+    allowed = tmp_path / "Content"
+    forbidden = allowed / "Secret"
+    forbidden.mkdir(parents=True)
+    path = tmp_path / "policy.yaml"
+    path.write_text(POLICY_YAML.format(allowed=allowed.as_posix(), forbidden=forbidden.as_posix()), encoding="utf-8")
+    return path
+
+
+def bump_mtime(path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_role_rules_deny_takes_precedence():
+    rules = RoleRules(allow=["editor.*"], deny=["editor.delete_*"])
+    assert rules.evaluate("editor.spawn_actor")
+    assert not rules.evaluate("editor.delete_actor")
+    assert not rules.evaluate("uat.buildcookrun")
+    assert not RoleRules().evaluate("anything")
+
+
+def test_evaluate_patterns_with_negations():
+    patterns = ["editor.*", " ", "!editor.delete_*"]
+    assert evaluate_patterns(patterns, "editor.get_actors")
+    assert not evaluate_patterns(patterns, "editor.delete_actor")
+    assert not evaluate_patterns([], "editor.get_actors")
+
+
+def test_cached_decisions_match_rule_evaluation():
+    policy = Policy(roles={"builder": RoleRules(allow=["*"], deny=["editor.delete_*"])})
+    for _ in range(2):
+        assert policy.is_tool_allowed("builder", "editor.spawn_actor")
+        assert not policy.is_tool_allowed("builder", "editor.delete_actor")
+        assert not policy.is_tool_allowed("unknown", "editor.spawn_actor")
+
+
+def test_decision_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(policy_module, "_MAX_CACHED_DECISIONS", 8)
+    policy = Policy(roles={"builder": RoleRules(allow=["*"])})
+    for index in range(50):
+        assert policy.is_tool_allowed("builder", f"tool{index}")
+    assert len(policy._decisions) <= 8
+
+
+def test_loader_parses_roles_limits_and_paths(policy_file):
+    loaded = PolicyLoader(policy_file).load()
+    assert loaded.is_tool_allowed("viewer", "editor.get_actors")
+    assert not loaded.is_tool_allowed("viewer", "editor.spawn_actor")
+    assert loaded.limits.rate_per_minute_global == 60
+    assert loaded.limits.rate_per_minute_per_tool == 10
+
+    content = policy_file.parent / "Content"
+    assert loaded.paths.is_path_allowed(str(content / "Map.umap"))
+    assert not loaded.paths.is_path_allowed(str(content / "Secret" / "key.pem"))
+    assert not loaded.paths.is_path_allowed(str(policy_file.parent / "Other" / "a"))
+
+
+def test_loader_reuses_policy_until_file_changes(policy_file):
+    loader = PolicyLoader(policy_file, refresh_interval=0)
+    first = loader.load()
+    assert loader.load() is first
+
+    policy_file.write_text("roles:\n  viewer:\n    allow: ['*']\n", encoding="utf-8")
+    bump_mtime(policy_file)
+    second = loader.load()
+    assert second is not first
+    assert second.is_tool_allowed("viewer", "editor.spawn_actor")
+
+
+def test_loader_skips_stat_within_refresh_interval(policy_file):
+    loader = PolicyLoader(policy_file, refresh_interval=3600)
+    first = loader.load()
+
+    policy_file.write_text("roles: {}\n", encoding="utf-8")
+    bump_mtime(policy_file)
+    assert loader.load() is first
+    forced = loader.load(force=True)
+    assert forced is not first
+    assert not forced.is_tool_allowed("viewer", "editor.get_actors")
+
+
+def test_loader_without_file_returns_defaults(tmp_path, monkeypatch):
+    monkeypatch.delenv("MCP_POLICY_PATH", raising=False)
+    loader = PolicyLoader(tmp_path / "missing.yaml", refresh_interval=0)
+    loaded = loader.load()
+    assert loaded.roles == {}
+    assert loaded.limits.rate_per_minute_global == 120
+    assert loader.load() is loaded
+
+
+def test_loader_picks_up_file_created_later(tmp_path, policy_file):
+    target = tmp_path / "late.yaml"
+    loader = PolicyLoader(target, refresh_interval=0)
+    assert loader.load().roles == {}
+
+    target.write_bytes(policy_file.read_bytes())
+    assert "viewer" in loader.load().roles
+
+
+def test_loader_reads_path_from_environment(policy_file, monkeypatch):
+    monkeypatch.setenv("MCP_POLICY_PATH", str(policy_file))
+    assert PolicyLoader().policy_path == policy_file.resolve()
@@ -1,3 +1,4 @@
+import io
 import json
 from typing import Any, Dict
 
@@ -8,28 +9,26 @@ from protocol import ProtocolError, current_timestamp_ms, read_frame, write_fram
 
 class FakeSocket:
     def __init__(self, initial: bytes | None = None) -> None:
-        self._buffer = bytearray(initial or b"")
-        self._read_offset = 0
+        self._buf = io.BytesIO(initial or b"")
+        self._out = bytearray()
         self._timeout = None
 
     def settimeout(self, timeout):  # pragma: no cover - setter does not affect tests
         self._timeout = timeout
 
     def send(self, data: bytes) -> int:
-        self._buffer.extend(data)
+        self._out.extend(data)
         return len(data)
 
     def recv(self, size: int) -> bytes:
-        if self._read_offset >= len(self._buffer):
-            return b""
-        end = min(self._read_offset + size, len(self._buffer))
-        chunk = bytes(self._buffer[self._read_offset:end])
-        self._read_offset = end
-        return chunk
+        return self._buf.read(size)
+
+    def recv_into(self, view: memoryview) -> int:
+        return self._buf.readinto(view)
 
     # Helpers for tests
     def buffer(self) -> bytes:
-        return bytes(self._buffer)
+        return bytes(self._out)
 
 
 def test_write_and_read_frame_roundtrip():
@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+
+from security import rate_limit
+from security.rate_limit import RateLimitConfig, RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    monkeypatch.setattr(rate_limit, "time", fake_clock)
+    return fake_clock
+
+
+def make_limiter(per_minute_global: int, per_minute_tool: int) -> RateLimiter:
+    return RateLimiter(RateLimitConfig(per_minute_global=per_minute_global, per_minute_tool=per_minute_tool))
+
+
+def allowed_count(limiter: RateLimiter, tool: str, attempts: int) -> int:
+    return sum(limiter.check(tool)[0] for _ in range(attempts))
+
+
+def test_per_tool_capacity(clock):
+    limiter = make_limiter(per_minute_global=100, per_minute_tool=3)
+    assert allowed_count(limiter, "spawn", 3) == 3
+
+    ok, retry_after = limiter.check("spawn")
+    assert not ok
+    assert retry_after == pytest.approx(20.0)
+
+    # Other tools have their own bucket.
+    assert limiter.check("delete")[0]
+
+
+def test_global_capacity_spans_tools(clock):
+    limiter = make_limiter(per_minute_global=5, per_minute_tool=10)
+    results = [limiter.check(f"tool{index % 3}")[0] for index in range(8)]
+    assert results == [True] * 5 + [False] * 3
+
+    ok, retry_after = limiter.check("tool0")
+    assert not ok
+    assert retry_after == pytest.approx(12.0)
+
+
+def test_global_rejection_refunds_tool_token(clock):
+    limiter = make_limiter(per_minute_global=2, per_minute_tool=3)
+    assert allowed_count(limiter, "a", 2) == 2
+    # Rejected by the global bucket; these must not drain "b".
+    assert allowed_count(limiter, "b", 5) == 0
+
+    clock.advance(60)
+    assert allowed_count(limiter, "b", 3) == 2
+    clock.advance(60)
+    assert allowed_count(limiter, "b", 3) == 2
+
+
+def test_tokens_refill_over_time(clock):
+    limiter = make_limiter(per_minute_global=100, per_minute_tool=3)
+    assert allowed_count(limiter, "spawn", 3) == 3
+
+    clock.advance(19.9)
+    assert not limiter.check("spawn")[0]
+    clock.advance(0.2)
+    assert limiter.check("spawn")[0]
+    assert not limiter.check("spawn")[0]
+
+
+def test_idle_time_does_not_exceed_capacity(clock):
+    limiter = make_limiter(per_minute_global=100, per_minute_tool=3)
+    clock.advance(3600)
+    assert allowed_count(limiter, "spawn", 10) == 3
+
+
+def test_zero_capacity_always_rejects(clock):
+    limiter = make_limiter(per_minute_global=100, per_minute_tool=0)
+    ok, retry_after = limiter.check("spawn")
+    assert not ok
+    assert retry_after == limiter.window
+
+
+def run_concurrently(limiter: RateLimiter, tools, threads: int, calls_per_thread: int) -> int:
+    allowed = []
+    barrier = threading.Barrier(threads)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        count = 0
+        for call in range(calls_per_thread):
+            tool = tools[(index + call) % len(tools)]
+            count += limiter.check(tool)[0]
+        allowed.append(count)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(allowed)
+
+
+def test_concurrent_callers_never_exceed_tool_capacity(clock):
+    limiter = make_limiter(per_minute_global=10_000, per_minute_tool=30)
+    assert run_concurrently(limiter, ["spawn"], threads=16, calls_per_thread=50) == 30
+
+
+def test_concurrent_callers_never_exceed_global_capacity(clock):
+    limiter = make_limiter(per_minute_global=100, per_minute_tool=1000)
+    tools = [f"tool{index}" for index in range(40)]
+    assert run_concurrently(limiter, tools, threads=16, calls_per_thread=50) == 100
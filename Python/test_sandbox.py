@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from security.policy import PathRules
+from security.sandbox import is_path_allowed, is_path_allowed_normalized, normalize_roots
+
+
+@pytest.fixture
+def roots(tmp_path):
+    allowed = tmp_path / "allowed"
+    forbidden = tmp_path / "allowed" / "secret"
+    outside = tmp_path / "outside"
+    for path in (allowed, forbidden, outside):
+        path.mkdir(parents=True, exist_ok=True)
+    return allowed, forbidden, outside
+
+
+def test_allowed_and_forbidden_roots(roots):
+    allowed, forbidden, outside = roots
+    assert is_path_allowed(str(allowed / "a.uasset"), [str(allowed)], [str(forbidden)])
+    assert is_path_allowed(str(allowed), [str(allowed)], [])
+    assert not is_path_allowed(str(forbidden / "key.pem"), [str(allowed)], [str(forbidden)])
+    assert not is_path_allowed(str(outside / "a.uasset"), [str(allowed)], [])
+
+
+def test_empty_allowed_roots_permit_everything_not_forbidden(roots):
+    allowed, forbidden, outside = roots
+    assert is_path_allowed(str(outside / "a"), [], [str(forbidden)])
+    assert not is_path_allowed(str(forbidden / "a"), [], [str(forbidden)])
+
+
+def test_sibling_with_shared_prefix_is_not_inside_root(tmp_path):
+    root = tmp_path / "Content"
+    sibling = tmp_path / "ContentBackup"
+    root.mkdir()
+    sibling.mkdir()
+    assert not is_path_allowed(str(sibling / "a"), [str(root)], [])
+
+
+def test_dotdot_escape_is_rejected(roots):
+    allowed, _, outside = roots
+    escaped = os.path.join(str(allowed), "..", "outside", "a")
+    assert not is_path_allowed(escaped, [str(allowed)], [])
+
+
+def test_relative_paths_follow_the_current_directory(roots, monkeypatch):
+    allowed, _, outside = roots
+    monkeypatch.chdir(allowed)
+    assert is_path_allowed("a.uasset", [str(allowed)], [])
+    monkeypatch.chdir(outside)
+    assert not is_path_allowed("a.uasset", [str(allowed)], [])
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unavailable")
+def test_symlink_swap_is_seen_on_every_check(roots):
+    allowed, forbidden, _ = roots
+    candidate = allowed / "link"
+    candidate.write_text("plain file")
+    assert is_path_allowed(str(candidate), [str(allowed)], [str(forbidden)])
+
+    candidate.unlink()
+    try:
+        candidate.symlink_to(forbidden / "key.pem")
+    except OSError:
+        pytest.skip("cannot create symlinks here")
+    assert not is_path_allowed(str(candidate), [str(allowed)], [str(forbidden)])
+
+
+def test_symlink_out_of_allowed_root_is_rejected(roots):
+    allowed, _, outside = roots
+    link = allowed / "escape"
+    try:
+        link.symlink_to(outside, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("cannot create symlinks here")
+    assert not is_path_allowed(str(link / "a"), [str(allowed)], [])
+
+
+def test_path_rules_match_unnormalized_helper(roots):
+    allowed, forbidden, outside = roots
+    rules = PathRules(allowed=[str(allowed)], forbidden=[str(forbidden)])
+    assert rules.allowed_norm == normalize_roots([str(allowed)])
+    for candidate in (allowed / "a", forbidden / "b", outside / "c", allowed):
+        expected = is_path_allowed(str(candidate), [str(allowed)], [str(forbidden)])
+        assert rules.is_path_allowed(str(candidate)) is expected
+        assert is_path_allowed_normalized(str(candidate), rules.allowed_norm, rules.forbidden_norm) is expected
@@ -0,0 +1,206 @@
+"""Streamed log parsing must agree with the earlier read-the-whole-log parsers."""
+
+import re
+import subprocess
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+import uat
+from automation import spawn_process
+from automation_specs import _ResultCollector
+
+# Writes the file named in argv[1] to stdout in uneven chunks, pausing between
+# writes so the reader sees lines split across reads.
+CHUNKED_WRITER = """
+import sys, time
+data = open(sys.argv[1], "rb").read()
+sizes = (1, 3, 17, 64, 251, 2)
+out = sys.stdout.buffer
+pos = index = 0
+while pos < len(data):
+    size = sizes[index % len(sizes)]
+    out.write(data[pos:pos + size])
+    out.flush()
+    pos += size
+    index += 1
+    time.sleep(0.0005)
+"""
+
+# --- Reference parsers, as they read the finished log before output was scanned while streaming.
+
+SUMMARY_RE = re.compile(
+    r"LogAutomationController:\s+\w+:\s+Tests? Completed\. \(Pass/Fail/Skipped = (\d+)/(\d+)/(\d+)\)",
+    re.IGNORECASE,
+)
+FAILURE_RE = re.compile(r"LogAutomationController:\s+(Error|Warning):\s+(.*)")
+
+
+def reference_automation_results(log_path: Path) -> Tuple[Dict[str, Any], bool]:
+    summary: Optional[Dict[str, Any]] = None
+    failures: List[Dict[str, str]] = []
+    with open(log_path, "r", encoding="utf-8", errors="replace") as log_file:
+        for line in log_file:
+            match = SUMMARY_RE.search(line)
+            if match and summary is None:
+                passed, failed, skipped = (int(value) for value in match.groups())
+                summary = {"total": passed + failed + skipped, "passed": passed, "failed": failed, "skipped": skipped}
+            match = FAILURE_RE.search(line)
+            if not match:
+                continue
+            remainder = match.group(2).strip()
+            test_name = ""
+            message = remainder
+            if ":" in remainder:
+                potential_test, potential_message = remainder.split(":", 1)
+                if potential_test.strip():
+                    test_name = potential_test.strip()
+                    message = potential_message.strip()
+            elif " - " in remainder:
+                potential_test, potential_message = remainder.split(" - ", 1)
+                test_name = potential_test.strip()
+                message = potential_message.strip()
+            failures.append({"test": test_name, "message": message})
+    parse_error = summary is None
+    if summary is None:
+        summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+    summary["failures"] = failures
+    return summary, parse_error
+
+
+def reference_uat_log(log_path: Path) -> Tuple[Optional[int], List[str], List[str]]:
+    exit_code: Optional[int] = None
+    highlights: List[str] = []
+    last_lines: deque = deque(maxlen=50)
+    with log_path.open("r", encoding="utf-8", errors="ignore") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line:
+                continue
+            last_lines.append(line)
+            if "AutomationTool exiting with ExitCode=" in line:
+                try:
+                    exit_code = int(line.split("ExitCode=")[-1].split()[0].strip(".[]"))
+                except (ValueError, IndexError):  # a bare "ExitCode=" used to raise IndexError
+                    pass
+            if (
+                "Cooked content" in line
+                or "Cooked packages" in line
+                or ("Pak" in line and "completed" in line)
+                or ("Archive" in line and "directory" in line)
+                or line.startswith("PackagingResults:")
+                or "BUILD SUCCESS" in line
+                or "BUILD FAILED" in line
+                or "Packaging failed" in line
+                or "PROJECT PACKAGED" in line
+            ):
+                if line not in highlights:
+                    highlights.append(line)
+    return exit_code, highlights, list(last_lines)
+
+
+# --- Sample output, exercising CRLF, lone CR, blank lines, invalid UTF-8 and a missing final newline.
+
+AUTOMATION_LOG = b"".join(
+    [
+        b"[2024.01.01-10.00.00:000][  0]LogInit: Display: Starting\n",
+        b"[2024.01.01-10.00.01:000][  1]LogAutomationController: Error: Game.Math.Add: expected 2 got 3\n",
+        b"LogAutomationController: Warning:\tGame.Render - slow frame\r\n",
+        b"LogAutomationController: Error:   just a message   \n",
+        b"progress 10%\rLogAutomationController: Error: Game.CR: after carriage return\n",
+        b"LogAutomationController: Error: Game.A: first\rLogAutomationController: Warning: Game.B: second\n",
+        b"LogAutomationController: Error: Game.Utf8: caf\xc3\xa9 \xff broken\n",
+        b"\n   \n",
+        b"LogAutomationController: Display: Tests Completed. (Pass/Fail/Skipped = 10/3/1)\r\n",
+        b"logautomationcontroller: display: test completed. (Pass/Fail/Skipped = 99/0/0)\n",
+    ]
+    + [b"LogAutomationController: Display: filler line %d\n" % index for index in range(40)]
+    + [b"LogAutomationController: Error: Game.Last: no trailing newline"]
+)
+
+UAT_LOG = b"".join(
+    [b"[UAT] filler output line %d\n" % index for index in range(30)]
+    + [
+        b"LogCook: Display: Cooked packages 1234 Packages Remain 0\r\n",
+        b"LogCook: Display: Cooked packages 1234 Packages Remain 0\r\n",
+        b"\n  \t \n",
+        b"Creating pak file ... Pak creation completed\n",
+        b"completed stage for Pak\n",
+        b"Copying to Archive directory /tmp/archive\n",
+        b"  PackagingResults: Success\n",
+        b"AutomationTool exiting with ExitCode=\n",
+        b"stage 1\rBUILD SUCCESSFUL\r\n",
+        b"odd bytes \xff\xfe Cooked content here\n",
+        b"AutomationTool exiting with ExitCode=7 (Error_Unknown)\n",
+    ]
+    + [b"[UAT] trailing output %d\n" % index for index in range(30)]
+    + [b"PROJECT PACKAGED; AutomationTool exiting with ExitCode=0 (Success)"]
+)
+
+
+@pytest.fixture
+def sample_path(tmp_path):
+    def write(data: bytes) -> Path:
+        path = tmp_path / "sample.log"
+        path.write_bytes(data)
+        return path
+
+    return write
+
+
+def test_result_collector_matches_reference_on_line_blocks(sample_path):
+    path = sample_path(AUTOMATION_LOG)
+    expected = reference_automation_results(path)
+
+    # Blocks end on LF, as spawn_process hands them over; a lone CR stays inside a block.
+    lines = re.findall(rb"[^\n]*\n|[^\n]+$", AUTOMATION_LOG)
+    for block_size in (1, 2, 5, len(lines)):
+        collector = _ResultCollector()
+        for start in range(0, len(lines), block_size):
+            collector(b"".join(lines[start : start + block_size]))
+        assert collector.results() == expected
+
+
+def test_spawned_output_is_scanned_like_the_reference(sample_path, tmp_path):
+    path = sample_path(AUTOMATION_LOG)
+    collector = _ResultCollector()
+    result = spawn_process(
+        [sys.executable, "-c", CHUNKED_WRITER, str(path)],
+        log_path=tmp_path / "spawned.log",
+        timeout_seconds=60,
+        output_scanner=collector,
+    )
+
+    assert result.exit_code == 0
+    assert result.log_path.read_bytes() == AUTOMATION_LOG
+    assert collector.results() == reference_automation_results(path)
+
+
+def test_uat_scan_matches_reference_on_finished_log(sample_path):
+    path = sample_path(UAT_LOG)
+    expected = reference_uat_log(path)
+    assert expected[0] == 0
+    assert uat.parse_uat_log(path) == expected
+
+
+@pytest.mark.parametrize("stream", [uat.stream_output, uat._stream_output_threaded])
+def test_uat_streamed_output_matches_reference(stream, sample_path, tmp_path):
+    if stream is uat.stream_output and sys.platform == "win32":
+        pytest.skip("stream_output delegates to the threaded reader on Windows")
+    path = sample_path(UAT_LOG)
+    process = subprocess.Popen(
+        [sys.executable, "-c", CHUNKED_WRITER, str(path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    log_path = tmp_path / "uat.log"
+    with log_path.open("wb") as log_file:
+        timed_out, scan = stream(process, log_file, 60)
+    process.wait()
+
+    assert not timed_out
+    assert log_path.read_bytes() == UAT_LOG
+    assert (scan.exit_code, scan.highlights, scan.last_lines) == reference_uat_log(path)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 import queue
+import re
+import selectors
 import signal
 import subprocess
 import threading
@@ -12,11 +14,13 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Sequence
 
 LOG_ROOT = Path("logs") / "uat"
+_READ_CHUNK_SIZE = 64 * 1024
 DEFAULT_ARCHIVE_ROOT = Path("builds")
-SUPPORTED_PLATFORMS = {
+_PLATFORM_ALIASES = {
     "win64": "Win64",
     "windows": "Win64",
     "win": "Win64",
@@ -31,6 +35,10 @@ SUPPORTED_PLATFORMS = {
     "xboxseriesx": "XSX",
     "xsx": "XSX",
 }
+# Read-only; canonical names map to themselves so already-normalized input skips strip()/lower().
+SUPPORTED_PLATFORMS = MappingProxyType(
+    {**_PLATFORM_ALIASES, **{name: name for name in _PLATFORM_ALIASES.values()}}
+)
 INTERESTING_ARTIFACT_PATTERNS = [
     "*.exe",
     "*.app",
@@ -42,6 +50,21 @@ INTERESTING_ARTIFACT_PATTERNS = [
     "*.zip",
     "*.tar",
 ]
+_ARTIFACT_SUFFIXES = tuple(os.path.normcase(pattern[1:]) for pattern in INTERESTING_ARTIFACT_PATTERNS)
+
+# Output is scanned as raw bytes; only matched lines and the tail are ever decoded.
+_EXIT_MARKER = b"AutomationTool exiting with ExitCode="
+# Lines worth surfacing in the tool response; the Pak/Archive pairs match in either order.
+_HIGHLIGHT_PATTERN = (
+    rb"Cooked (?:content|packages)"
+    rb"|Pak.*completed|completed.*Pak"
+    rb"|Archive.*directory|directory.*Archive"
+    rb"|^PackagingResults:"
+    rb"|BUILD SUCCESS|BUILD FAILED|Packaging failed|PROJECT PACKAGED"
+)
+UAT_HIGHLIGHT_RE = re.compile(_HIGHLIGHT_PATTERN)
+# One search per line rejects the vast majority of output; ``exit`` names the exit code branch.
+UAT_LINE_RE = re.compile(rb"(?P<exit>" + re.escape(_EXIT_MARKER) + rb")|(?P<highlight>" + _HIGHLIGHT_PATTERN + rb")")
 
 
 class ToolError(Exception):
@@ -63,6 +86,57 @@ class ToolError(Exception):
         }
 
 
+@dataclass
+class UatLogScan:
+    """Exit code, highlight lines and tail collected from RunUAT output line by line."""
+
+    exit_code: Optional[int] = None
+    highlights: List[str] = field(default_factory=list)
+    _tail: deque = field(default_factory=lambda: deque(maxlen=50), init=False, repr=False)
+    _seen: set = field(default_factory=set, init=False, repr=False)
+
+    @property
+    def last_lines(self) -> List[str]:
+        return [_decode_line(line) for line in self._tail]
+
+    def feed(self, raw_line: bytes) -> None:
+        line = raw_line.strip()
+        if not line:
+            return
+        if b"\r" in line:
+            # A lone CR ends a line too, as it did when the output was read as text.
+            for part in line.split(b"\r"):
+                self.feed(part)
+            return
+        self._tail.append(line)
+        match = UAT_LINE_RE.search(line)
+        if match is None:
+            return
+        if match.lastgroup == "exit":
+            self._parse_exit_code(line)
+            highlight = UAT_HIGHLIGHT_RE.search(line) is not None
+        else:
+            # Rare: a highlight line that also reports the exit code further along.
+            if _EXIT_MARKER in line:
+                self._parse_exit_code(line)
+            highlight = True
+        if highlight:
+            text = _decode_line(line)
+            if text not in self._seen:
+                self._seen.add(text)
+                self.highlights.append(text)
+
+    def _parse_exit_code(self, line: bytes) -> None:
+        try:
+            self.exit_code = int(line.split(b"ExitCode=")[-1].split()[0].strip(b".[]"))
+        except (ValueError, IndexError):
+            pass
+
+
+def _decode_line(line: bytes) -> str:
+    return line.decode("utf-8", errors="ignore")
+
+
 @dataclass
 class BuildCookRunConfig:
     """Configuration for a BuildCookRun invocation."""
@@ -217,6 +291,9 @@ class BuildCookRunConfig:
 def normalize_platform(value: Any) -> Optional[str]:
     if not isinstance(value, str):
         return None
+    canonical = SUPPORTED_PLATFORMS.get(value)
+    if canonical is not None:
+        return canonical
     key = value.strip().lower()
     return SUPPORTED_PLATFORMS.get(key) or (value if value else None)
 
@@ -254,16 +331,17 @@ def build_dry_run_result(config: BuildCookRunConfig, platform_name: str) -> Dict
     command_parts = build_base_command(config, platform_name)
     command_line = format_command_line(config, command_parts)
 
-    project_saved = config.project_dir / "Saved"
+    # Previews are built from strings only; nothing here touches the filesystem.
+    project_saved = os.path.join(str(config.project_dir), "Saved")
     would_write: List[str] = []
     if config.archive and config.archive_dir:
-        would_write.append(str(config.archive_dir.resolve()))
+        would_write.append(os.path.abspath(config.archive_dir))
     if config.cook:
-        would_write.append(str((project_saved / "Cooked").resolve()))
+        would_write.append(os.path.normpath(os.path.join(project_saved, "Cooked")))
     if config.stage:
-        would_write.append(str((project_saved / "StagedBuilds").resolve()))
+        would_write.append(os.path.normpath(os.path.join(project_saved, "StagedBuilds")))
     if config.package:
-        would_write.append(str((project_saved / "Logs").resolve()))
+        would_write.append(os.path.normpath(os.path.join(project_saved, "Logs")))
 
     return {
         "ok": True,
@@ -297,23 +375,22 @@ def execute_buildcookrun(config: BuildCookRunConfig, platform_name: str) -> Dict
 
     start_time = time.monotonic()
     timed_out = False
-    tail_lines: List[str] = []
+    scan = UatLogScan()
 
-    with log_path.open("w", encoding="utf-8", errors="ignore") as log_file:
+    # The log receives RunUAT's bytes verbatim; UatLogScan decodes only what the response needs.
+    with log_path.open("wb") as log_file:
         process = subprocess.Popen(
             process_args,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
             cwd=str(config.engine_root),
             env=env,
-            bufsize=1,
-            universal_newlines=True,
+            bufsize=_READ_CHUNK_SIZE,
             creationflags=creationflags,
             preexec_fn=preexec_fn,
         )
         try:
-            timed_out, tail_lines = stream_output(process, log_file, config.timeout_seconds)
+            timed_out, scan = stream_output(process, log_file, config.timeout_seconds)
         finally:
             if timed_out and process.poll() is None:
                 terminate_process(process, config.is_windows)
@@ -322,18 +399,22 @@ def execute_buildcookrun(config: BuildCookRunConfig, platform_name: str) -> Dict
     duration = int(time.monotonic() - start_time)
 
     exit_code = process.returncode if process.returncode is not None else -1
-    parsed_exit, highlights, last_lines = parse_uat_log(log_path)
-    if parsed_exit is not None:
-        exit_code = parsed_exit
-
-    logs: Dict[str, Any] = {"uatLog": str(log_path.resolve())}
+    # Highlights and the exit code line were collected while streaming; no second pass over the log.
+    highlights = scan.highlights
+    last_lines = scan.last_lines
+    if scan.exit_code is not None:
+        exit_code = scan.exit_code
+
+    uat_log = str(log_path.resolve())
+    logs: Dict[str, Any] = {"uatLog": uat_log}
     cook_log = find_latest_cook_log(config.project_dir)
     if cook_log:
         logs["cookLog"] = cook_log
 
+    archive_dir = config.archive_dir.resolve() if config.archive and config.archive_dir else None
     artifacts: List[str] = []
-    if config.archive and config.archive_dir:
-        artifacts = collect_artifacts(config.archive_dir)
+    if archive_dir is not None:
+        artifacts = collect_artifacts(archive_dir)
 
     result: Dict[str, Any] = {
         "ok": not timed_out and exit_code == 0,
@@ -361,8 +442,8 @@ def execute_buildcookrun(config: BuildCookRunConfig, platform_name: str) -> Dict
             "message": "RunUAT timed out before completion.",
             "details": {
                 "timeoutSeconds": config.timeout_seconds,
-                "uatLog": str(log_path.resolve()),
-                "lastLines": tail_lines[-20:],
+                "uatLog": uat_log,
+                "lastLines": last_lines[-20:],
             },
         }
         result["timedOut"] = True
@@ -375,18 +456,18 @@ def execute_buildcookrun(config: BuildCookRunConfig, platform_name: str) -> Dict
             "message": "RunUAT returned a non-zero exit code.",
             "details": {
                 "exitCode": exit_code,
-                "uatLog": str(log_path.resolve()),
-                "lastLines": last_lines[-20:] or tail_lines[-20:],
+                "uatLog": uat_log,
+                "lastLines": last_lines[-20:],
             },
         }
         return result
 
-    if config.archive and config.archive_dir and not artifacts:
+    if archive_dir is not None and not artifacts:
         result.setdefault("warnings", []).append(
             {
                 "code": "ARTIFACTS_NOT_FOUND",
                 "message": "No build artifacts were discovered.",
-                "details": {"archiveDir": str(config.archive_dir.resolve())},
+                "details": {"archiveDir": str(archive_dir)},
             }
         )
 
@@ -455,12 +536,59 @@ def format_command_line(config: BuildCookRunConfig, command_parts: List[str]) ->
 
 
 def stream_output(
-    process: subprocess.Popen[str],
+    process: subprocess.Popen[bytes],
     log_file,
     timeout_seconds: Optional[int],
-) -> tuple[bool, List[str]]:
-    tail = deque(maxlen=50)
-    q: "queue.Queue[Optional[str]]" = queue.Queue()
+) -> tuple[bool, UatLogScan]:
+    if os.name == "nt":
+        # Pipes cannot be registered with a selector on Windows.
+        return _stream_output_threaded(process, log_file, timeout_seconds)
+
+    assert process.stdout is not None
+    fd = process.stdout.fileno()
+    os.set_blocking(fd, False)
+    scan = UatLogScan()
+    partial = b""
+
+    deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+    timed_out = False
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            wait = None if deadline is None else deadline - time.monotonic()
+            if wait is not None and wait <= 0:
+                timed_out = True
+                break
+            if not selector.select(wait):
+                continue
+            try:
+                chunk = os.read(fd, _READ_CHUNK_SIZE)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                break
+
+            log_file.write(chunk)
+            log_file.flush()
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop()
+            for line in lines:
+                scan.feed(line)
+
+    # A last line without a trailing newline is already in the log; it still needs scanning.
+    if partial:
+        scan.feed(partial)
+    return timed_out, scan
+
+
+def _stream_output_threaded(
+    process: subprocess.Popen[bytes],
+    log_file,
+    timeout_seconds: Optional[int],
+) -> tuple[bool, UatLogScan]:
+    scan = UatLogScan()
+    q: "queue.Queue[Optional[bytes]]" = queue.Queue()
 
     def reader() -> None:
         try:
@@ -491,17 +619,17 @@ def stream_output(
             break
         log_file.write(item)
         log_file.flush()
-        tail.append(item.strip())
+        scan.feed(item)
 
         if deadline and time.monotonic() > deadline:
             timed_out = True
             break
 
     thread.join(timeout=1.0)
-    return timed_out, list(tail)
+    return timed_out, scan
 
 
-def terminate_process(process: subprocess.Popen[str], is_windows: bool) -> None:
+def terminate_process(process: subprocess.Popen[bytes], is_windows: bool) -> None:
     try:
         if is_windows:
             ctrl_break = getattr(signal, "CTRL_BREAK_EVENT", None)
@@ -525,46 +653,16 @@ def terminate_process(process: subprocess.Popen[str], is_windows: bool) -> None:
 
 
 def parse_uat_log(log_path: Path) -> tuple[Optional[int], List[str], List[str]]:
-    exit_code: Optional[int] = None
-    highlights: List[str] = []
-    last_lines: deque[str] = deque(maxlen=50)
+    """Scan a finished UAT log from disk; execute_buildcookrun scans while streaming instead."""
 
+    scan = UatLogScan()
     if not log_path.exists():
-        return exit_code, highlights, list(last_lines)
+        return scan.exit_code, scan.highlights, scan.last_lines
 
-    with log_path.open("r", encoding="utf-8", errors="ignore") as handle:
+    with log_path.open("rb") as handle:
         for raw_line in handle:
-            line = raw_line.strip()
-            if not line:
-                continue
-            last_lines.append(line)
-            if "AutomationTool exiting with ExitCode=" in line:
-                try:
-                    exit_code = int(line.split("ExitCode=")[-1].split()[0].strip(".[]"))
-                except ValueError:
-                    pass
-            if "Cooked content" in line or "Cooked packages" in line:
-                if line not in highlights:
-                    highlights.append(line)
-            if "Pak" in line and "completed" in line:
-                if line not in highlights:
-                    highlights.append(line)
-            if "Archive" in line and "directory" in line:
-                if line not in highlights:
-                    highlights.append(line)
-            if line.startswith("PackagingResults:"):
-                if line not in highlights:
-                    highlights.append(line)
-            if "BUILD SUCCESS" in line or "BUILD SUCCESSFUL" in line:
-                if line not in highlights:
-                    highlights.append(line)
-            if "BUILD FAILED" in line or "Packaging failed" in line:
-                if line not in highlights:
-                    highlights.append(line)
-            if "PROJECT PACKAGED" in line:
-                if line not in highlights:
-                    highlights.append(line)
-    return exit_code, highlights, list(last_lines)
+            scan.feed(raw_line)
+    return scan.exit_code, scan.highlights, scan.last_lines
 
 
 def find_latest_cook_log(project_dir: Path) -> Optional[str]:
@@ -581,18 +679,26 @@ def find_latest_cook_log(project_dir: Path) -> Optional[str]:
 def collect_artifacts(archive_dir: Path) -> List[str]:
     if not archive_dir.exists():
         return []
-
-    artifacts: List[str] = []
-    for pattern in INTERESTING_ARTIFACT_PATTERNS:
-        for path in archive_dir.rglob(pattern):
-            artifacts.append(str(path.resolve()))
+    # Resolve the root once; walked paths are joined onto it rather than resolved one by one.
+    archive_dir = archive_dir.resolve()
+
+    # One walk instead of an rglob per pattern; matches are grouped back into pattern order.
+    # Directories count too, since e.g. ``*.app`` bundles are folders.
+    matches: Dict[str, List[str]] = {suffix: [] for suffix in _ARTIFACT_SUFFIXES}
+    for root, dirs, files in os.walk(archive_dir):
+        for name in dirs + files:
+            dot = name.rfind(".")
+            if dot < 0:
+                continue
+            bucket = matches.get(os.path.normcase(name[dot:]))
+            if bucket is not None:
+                bucket.append(os.path.join(root, name))
+    artifacts = [path for bucket in matches.values() for path in bucket]
 
     if not artifacts:
         for path in sorted(archive_dir.glob("**/*")):
-            if path.is_file():
-                artifacts.append(str(path.resolve()))
-            elif path.is_dir():
-                artifacts.append(str(path.resolve()))
+            if path.is_file() or path.is_dir():
+                artifacts.append(str(path))
             if len(artifacts) >= 20:
                 break
 
@@ -383,7 +383,7 @@ class UnrealConnection:
             )
             return deepcopy(cached_response)
         start_time = time.time()
-        start_ts_ms = start_time * 1000.0
+        start_ts_ms = int(start_time * 1000)
 
         if is_mutation:
             config = get_server_config()
@@ -573,6 +573,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         if _unreal_connection:
             _unreal_connection.disconnect()
             _unreal_connection = None
+        DEDUP_STORE.close()
         logger.info("Unreal MCP server shut down")
 
 # Initialize server